@@ -0,0 +1,133 @@
+import os
+import re
+import json
+import time
+import tempfile
+import warnings
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from statsmodels.tsa.arima.model import ARIMA
+import forecasting
+import model_store
+
+# Auto-order configuration
+ARIMA_P_VALUES = range(0, 6)
+ARIMA_D_VALUES = range(0, 3)
+ARIMA_Q_VALUES = range(0, 3)
+ARIMA_CRITERION = os.environ.get("STOCKSENSE_ARIMA_CRITERION", "aic")  # "aic" or "bic"
+ARIMA_ORDER_TTL_DAYS = float(os.environ.get("STOCKSENSE_ARIMA_ORDER_TTL_DAYS", "7"))
+ARIMA_SEARCH_WORKERS = int(os.environ.get("STOCKSENSE_ARIMA_SEARCH_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+# One small JSON file per ticker, replaced atomically, so concurrent worker processes never rewrite a shared file
+ARIMA_ORDER_DIR = os.path.join(model_store.MODEL_STORE_DIR, "arima_orders")
+
+# ARIMA(5, 1, 0) on closing prices
+def arima_forecast(data, future_dates, ticker=None):
+    y = data['Close'].values.reshape(-1, 1)
+    model = ARIMA(y, order=(5, 1, 0))
+    forecasting.report_progress("Fitting ARIMA(5, 1, 0)", fraction=0.1)
+    model_fit = model.fit()
+    forecasting.report_progress(forecasting.FORECAST_STAGE, fraction=0.9)
+    return model_fit.forecast(steps=len(future_dates))
+
+# Runs in a search worker: information criterion of one candidate order, inf if it fails to fit
+def score_order(y, order, criterion=ARIMA_CRITERION):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            return getattr(ARIMA(y, order=order).fit(), criterion)
+        except (ValueError, np.linalg.LinAlgError):
+            return float("inf")
+
+# Search workers for this process: a pool of its own from the app's forecast job workers and top-level
+# callers, none from batch workers (backtest, forecast_cli), which already run one per core
+def search_workers():
+    if forecasting.in_batch_worker():
+        return 1
+    return ARIMA_SEARCH_WORKERS
+
+# Grid-search (p, d, q), in parallel worker processes when allowed, and return the order with the lowest criterion
+def select_order(y, criterion=ARIMA_CRITERION, workers=None):
+    candidates = list(itertools.product(ARIMA_P_VALUES, ARIMA_D_VALUES, ARIMA_Q_VALUES))
+    forecasting.report_progress(f"Searching {len(candidates)} ARIMA orders by {criterion.upper()}", fraction=0.05)
+    workers = search_workers() if workers is None else workers
+    if workers <= 1:
+        scores = [score_order(y, order, criterion) for order in candidates]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            scores = list(executor.map(score_order, itertools.repeat(y), candidates, itertools.repeat(criterion)))
+    best = int(np.argmin(scores))
+    if not np.isfinite(scores[best]):
+        raise ValueError("No ARIMA order could be fitted to this series.")
+    return candidates[best]
+
+def _order_path(ticker):
+    return os.path.join(ARIMA_ORDER_DIR, re.sub(r"[^A-Za-z0-9._-]", "_", ticker) + ".json")
+
+# Previously selected order for the ticker, if it was chosen by the same criterion within the TTL
+def cached_order(ticker, criterion=ARIMA_CRITERION):
+    try:
+        with open(_order_path(ticker), "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry["criterion"] != criterion:
+        return None
+    if time.time() - entry["selected_at"] > ARIMA_ORDER_TTL_DAYS * 86400:
+        return None
+    return tuple(entry["order"])
+
+# Write through a uniquely named temp file; concurrent writers for one ticker each replace it whole
+def store_order(ticker, order, criterion=ARIMA_CRITERION):
+    os.makedirs(ARIMA_ORDER_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=ARIMA_ORDER_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"order": list(order), "criterion": criterion, "selected_at": time.time()}, f)
+        os.replace(tmp_path, _order_path(ticker))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# Fitted results for the order, appending new bars to the stored fit instead of refitting when possible
+def fit_with_reuse(y, index, order, ticker=None):
+    label = f"ARIMA{order}"
+    store_key = f"{ticker}_arima_{'_'.join(map(str, order))}" if ticker else None
+    entry = model_store.load_results(store_key) if store_key else None
+    start_params = None
+    if entry is not None:
+        results, meta = entry
+        # append() can only extend the fit, so the last fitted bar must be unchanged
+        new_rows = model_store.new_rows_since(meta, y, index, revised_last=False)
+        if new_rows == 0:
+            return results
+        if new_rows is not None and new_rows <= model_store.MAX_FINE_TUNE_ROWS:
+            # Keep the fitted parameters and extend the state-space filter over the new bars
+            forecasting.report_progress(f"Updating {label} with {new_rows} new bars", fraction=0.5)
+            results = results.append(y[len(y) - new_rows:], refit=False)
+            model_store.save_results(store_key, results, y, index, order=list(order))
+            return results
+        # History diverged: refit, warm-started from the previous parameters
+        start_params = results.params
+
+    forecasting.report_progress(f"Fitting {label}", fraction=0.5)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        results = ARIMA(y, order=order).fit(start_params=start_params)
+    if store_key:
+        model_store.save_results(store_key, results, y, index, order=list(order))
+    return results
+
+# ARIMA with (p, d, q) chosen by information criterion and cached per ticker
+def auto_arima_forecast(data, future_dates, ticker=None):
+    y = data['Close'].values.astype(float)
+    order = cached_order(ticker) if ticker else None
+    if order is None:
+        order = select_order(y)
+        if ticker:
+            store_order(ticker, order)
+    results = fit_with_reuse(y, data.index, order, ticker)
+    forecasting.report_progress(forecasting.FORECAST_STAGE, fraction=0.9)
+    return np.asarray(results.forecast(steps=len(future_dates)))
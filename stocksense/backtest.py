@@ -0,0 +1,135 @@
+import os
+import time
+import resource
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import forecasting
+
+# Backtest defaults
+BACKTEST_FOLDS = 8
+BACKTEST_HORIZON = 20
+BACKTEST_MIN_TRAIN = 250
+BACKTEST_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Forecast origins (number of training rows) for rolling walk-forward folds.
+# Origins are spaced `horizon` bars apart so evaluation windows do not overlap.
+def walk_forward_origins(n_rows, horizon=BACKTEST_HORIZON, folds=BACKTEST_FOLDS, min_train=BACKTEST_MIN_TRAIN):
+    last_origin = n_rows - horizon
+    origins = [last_origin - i * horizon for i in range(folds)]
+    origins = [origin for origin in origins if origin >= min_train]
+    if not origins:
+        raise ValueError(f"Need at least {min_train + horizon} rows to backtest, got {n_rows}.")
+    return sorted(origins)
+
+# Accuracy of a forecast against the bars that followed the origin
+def forecast_errors(last_close, actual, predicted):
+    actual = np.asarray(actual, dtype=float)
+    predicted = np.asarray(predicted, dtype=float)
+    errors = predicted - actual
+    return {
+        "mae": float(np.mean(np.abs(errors))),
+        "mape": float(np.mean(np.abs(errors / actual)) * 100),
+        # Share of steps where the forecast moved away from the origin close in the right direction
+        "directional_accuracy": float(np.mean(np.sign(predicted - last_close) == np.sign(actual - last_close)) * 100),
+    }
+
+# Peak resident memory of this process so far, in MiB
+def _max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+# Runs in a worker process of its own: forecast one fold and measure fit/predict time and memory.
+# Timing runs untraced (tracemalloc slows Python-heavy backends far more than TensorFlow), and
+# memory comes from the process peak RSS, which also counts native allocations tracemalloc misses.
+def run_fold(history, origin, horizon, model_type):
+    train = history.iloc[:origin].copy()
+    actual = history.iloc[origin:origin + horizon]
+    last_date = train.index[-1]
+    # predict_stock_prices steps in calendar days; cover the evaluation bars and pick them out by date
+    days = max((actual.index[-1] - last_date).days, 1)
+
+    stage_times = {}
+    def record_stage(update):
+        stage_times.setdefault(update["stage"], time.perf_counter())
+    forecasting.get_forecaster(model_type)  # Exclude backend import time and memory from the fit
+    baseline_rss = _max_rss_mb()
+
+    forecasting.set_progress_callback(record_stage)
+    start = time.perf_counter()
+    try:
+        future_dates, predictions = forecasting.predict_stock_prices(train, days, model_type)
+    finally:
+        end = time.perf_counter()
+        forecasting.set_progress_callback(None)
+    max_rss = _max_rss_mb()
+
+    predict_start = stage_times.get(forecasting.FORECAST_STAGE, end)
+    offsets = [min(max((date - last_date).days - 1, 0), len(predictions) - 1) for date in actual.index]
+    result = {
+        "model": model_type,
+        "origin": str(last_date.date()),
+        "train_rows": len(train),
+        "horizon": len(actual),
+        "fit_seconds": predict_start - start,
+        "predict_seconds": end - predict_start,
+        "max_rss_mb": max_rss,
+        # Peak growth while fitting and predicting, on top of the loaded backend
+        "fit_rss_mb": max_rss - baseline_rss,
+    }
+    result.update(forecast_errors(train["Close"].iloc[-1], actual["Close"].values, np.asarray(predictions)[offsets]))
+    return result
+
+# Replay every model over rolling origins, fanning folds out across a process pool.
+# Each fold gets a fresh worker so its peak RSS is not an earlier fold's (ru_maxrss never goes down).
+def run_backtest(history, model_types=None, horizon=BACKTEST_HORIZON, folds=BACKTEST_FOLDS,
+                 min_train=BACKTEST_MIN_TRAIN, workers=BACKTEST_WORKERS):
+    model_types = model_types or forecasting.MODEL_TYPES
+    history = history[["Open", "High", "Low", "Close", "Volume"]]
+    origins = walk_forward_origins(len(history), horizon, folds, min_train)
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, max_tasks_per_child=1,
+                             initializer=forecasting.mark_batch_worker) as executor:
+        futures = [
+            executor.submit(run_fold, history, origin, horizon, model_type)
+            for model_type in model_types
+            for origin in origins
+        ]
+        return pd.DataFrame([future.result() for future in futures])
+
+# Per-model averages of accuracy and cost across folds
+def summarize(results):
+    return results.groupby("model", sort=False).agg(
+        folds=("origin", "count"),
+        mae=("mae", "mean"),
+        mape=("mape", "mean"),
+        directional_accuracy=("directional_accuracy", "mean"),
+        fit_seconds=("fit_seconds", "mean"),
+        predict_seconds=("predict_seconds", "mean"),
+        max_rss_mb=("max_rss_mb", "max"),
+        fit_rss_mb=("fit_rss_mb", "max"),
+    ).round(3)
+
+if __name__ == "__main__":
+    import history_cache
+
+    parser = argparse.ArgumentParser(description="Walk-forward backtest of the forecast models")
+    parser.add_argument("ticker", help="Ticker symbol to backtest")
+    parser.add_argument("--period", default="3y", help="History period to replay (default: 3y)")
+    parser.add_argument("--model", action="append", dest="models", choices=forecasting.MODEL_TYPES,
+                        help="Model to evaluate, repeatable (default: all)")
+    parser.add_argument("--horizon", type=int, default=BACKTEST_HORIZON, help="Bars forecast per fold")
+    parser.add_argument("--folds", type=int, default=BACKTEST_FOLDS, help="Number of rolling origins")
+    parser.add_argument("--min-train", type=int, default=BACKTEST_MIN_TRAIN, help="Minimum training rows")
+    parser.add_argument("--workers", type=int, default=BACKTEST_WORKERS, help="Worker processes")
+    parser.add_argument("--output", help="Write per-fold results to this CSV file")
+    args = parser.parse_args()
+
+    history = history_cache.history(args.ticker.upper(), period=args.period)
+    results = run_backtest(history, args.models, args.horizon, args.folds, args.min_train, args.workers)
+    if args.output:
+        results.to_csv(args.output, index=False)
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(summarize(results))
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+
+# Days from 0001-01-01 (date.toordinal) to the Unix epoch
+UNIX_EPOCH_ORDINAL = 719163
+
+# date.toordinal() for every timestamp in a DatetimeIndex, vectorized
+def date_ordinals(index):
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype("datetime64[D]").astype(np.int64) + UNIX_EPOCH_ORDINAL
+
+# Vandermonde matrix over t; callers rescale time to [-1, 1] first to keep the cubic well conditioned
+def design_matrix(t, degree):
+    return np.vander(t, degree + 1, increasing=True)
+
+# Calendar dates of a bar index, timezone dropped; duplicate dates (intraday bars) keep the last bar
+def _calendar_dates(index):
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    dates = index.normalize()
+    return dates, ~dates.duplicated(keep="last")
+
+# Align Close prices of many tickers on one calendar; returns the (dates x tickers) matrix
+# and each ticker's last timestamp, used to build its future dates
+def align_closes(histories):
+    calendars = {}
+    columns = {}
+    last_dates = {}
+    shared = None
+    for ticker, data in histories.items():
+        if data.empty:
+            continue
+        index = data.index
+        last_dates[ticker] = index[-1]
+        # Histories fetched for the same period usually share a calendar; convert each distinct one once.
+        # Indexes with the same length and end points can still differ in between, so match them in full.
+        candidates = calendars.setdefault((len(index), index[0], index[-1]), [])
+        calendar = next((calendar for calendar in candidates if calendar[0].equals(index)), None)
+        if calendar is None:
+            calendar = (index, *_calendar_dates(index))
+            candidates.append(calendar)
+        if shared is None:
+            shared = calendar
+        elif calendar is not shared:
+            shared = False
+        _, dates, keep = calendar
+        columns[ticker] = (dates[keep], data["Close"].to_numpy(dtype=float)[keep])
+
+    if shared:
+        # Every ticker has exactly the same index: stack the columns without reindexing
+        dates = next(iter(columns.values()))[0]
+        closes = np.column_stack([values for _, values in columns.values()])
+        return pd.DataFrame(closes, index=dates, columns=list(columns)), last_dates
+    closes = pd.DataFrame({ticker: pd.Series(values, index=dates) for ticker, (dates, values) in columns.items()})
+    return closes.sort_index(), last_dates
+
+# Fit a polynomial trend of `degree` to every column of `closes` in one solve.
+# Returns coefficients (tickers x degree+1) and the ordinal origin and scale used to normalize time.
+def fit_trends(closes, degree=3):
+    ordinals = date_ordinals(closes.index).astype(float)
+    origin = (ordinals[0] + ordinals[-1]) / 2
+    scale = max((ordinals[-1] - ordinals[0]) / 2, 1.0)
+    X = design_matrix((ordinals - origin) / scale, degree)
+    Y = closes.to_numpy(dtype=float)
+
+    observed = ~np.isnan(Y)
+    if observed.all():
+        # Shared design and no gaps: a single multi-right-hand-side least-squares solve
+        coefficients, *_ = np.linalg.lstsq(X, Y, rcond=None)
+        return coefficients.T, origin, scale
+
+    # Gaps differ per ticker: batched weighted normal equations, still one vectorized solve
+    weights = observed.astype(float)
+    Y = np.where(observed, Y, 0.0)
+    gram = np.einsum("nk,nd,ne->kde", weights, X, X)
+    moments = np.einsum("nk,nd,nk->kd", weights, X, Y)
+    return np.linalg.solve(gram, moments[..., None])[..., 0], origin, scale
+
+# Evaluate fitted trends for the `days` calendar days after each ticker's last bar -> (tickers x days)
+def predict_trends(coefficients, origin, scale, last_ordinals, days):
+    steps = np.arange(1, days + 1, dtype=float)
+    future_t = (np.asarray(last_ordinals, dtype=float)[:, None] + steps[None, :] - origin) / scale
+    # Horner's rule across all tickers and horizons at once
+    predictions = np.zeros_like(future_t)
+    for power in range(coefficients.shape[1] - 1, -1, -1):
+        predictions = predictions * future_t + coefficients[:, power][:, None]
+    return predictions
+
+# Forecast `days` calendar days past each ticker's last bar; same (future_dates, predictions)
+# contract as predict_stock_prices, returned per ticker
+def batch_forecast(histories, days, degree=3):
+    closes, last_dates = align_closes(histories)
+    if closes.empty:
+        return {}
+    coefficients, origin, scale = fit_trends(closes, degree)
+
+    tickers = list(closes.columns)
+    last_ordinals = [last_dates[ticker].toordinal() for ticker in tickers]
+    predictions = predict_trends(coefficients, origin, scale, last_ordinals, days)
+
+    steps = pd.to_timedelta(np.arange(1, days + 1), unit="D")
+    future_dates_by_last = {}
+    forecasts = {}
+    for row, ticker in enumerate(tickers):
+        last_date = last_dates[ticker]
+        if last_date not in future_dates_by_last:
+            future_dates_by_last[last_date] = list(last_date + steps)
+        forecasts[ticker] = (list(future_dates_by_last[last_date]), predictions[row])
+    return forecasts
@@ -0,0 +1,60 @@
+import os
+import sys
+import argparse
+import subprocess
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages that must stay out of the app shell until a model needs them
+DEFERRED_PACKAGES = ["tensorflow", "keras", "statsmodels", "sklearn"]
+
+# Import a module in a fresh interpreter under -X importtime; returns cumulative seconds
+# per import at nesting depth 0 (the module itself) and 1 (its direct imports)
+def profile_import(module):
+    probe = f"import sys, {module}; print('LOADED=' + ','.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=APP_DIR, capture_output=True, text=True, check=True
+    )
+    cumulative = {0: {}, 1: {}}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        # Each nesting level indents the name by two more spaces
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth in cumulative:
+            cumulative[depth][name.strip()] = int(cumulative_us) / 1e6
+    loaded = set()
+    for line in result.stdout.splitlines():
+        if line.startswith("LOADED="):
+            loaded = set(line[len("LOADED="):].split(","))
+    return cumulative, loaded
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the app shell import time and deferred model backends")
+    parser.add_argument("--module", default="app", help="Module to import (default: app)")
+    parser.add_argument("--budget", type=float, default=3.0, help="Import time budget in seconds")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest packages to list")
+    args = parser.parse_args()
+
+    cumulative, loaded = profile_import(args.module)
+    total = cumulative[0].get(args.module, 0.0)
+    print(f"import {args.module}: {total:.2f}s (budget {args.budget:.2f}s)")
+    for name, seconds in sorted(cumulative[1].items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {name:<24}{seconds:>8.3f}s")
+
+    resident = [name for name in DEFERRED_PACKAGES if name in loaded]
+    failed = False
+    if resident:
+        print(f"FAIL: deferred packages loaded at startup: {', '.join(resident)}")
+        failed = True
+    if total > args.budget:
+        print("FAIL: import time over budget")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
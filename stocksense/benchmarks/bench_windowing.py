@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import windowing
+
+# Series lengths in bars: 3y and 10y of daily closes, 60 sessions of 1-minute bars
+SERIES_LENGTHS = {
+    "3y daily": 756,
+    "10y daily": 2520,
+    "intraday 60x390": 23400,
+}
+
+# The list-append construction the LSTM path used before windowing.sliding_windows
+def loop_dataset(dataset, time_step=1):
+    X, y = [], []
+    for i in range(len(dataset) - time_step - 1):
+        X.append(dataset[i:(i + time_step), 0])
+        y.append(dataset[i + time_step, 0])
+    return np.array(X), np.array(y)
+
+def strided_dataset(dataset, time_step=1):
+    return windowing.sliding_windows(dataset, time_step)
+
+# Best-of-N wall time and peak traced allocation for one construction
+def measure(build, dataset, window, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build(dataset, window)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    build(dataset, window)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LSTM sliding-window dataset construction")
+    parser.add_argument("--window", type=int, default=60)
+    parser.add_argument("--features", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'series':<18}{'rows':>8}{'method':>10}{'time (ms)':>12}{'peak (KiB)':>12}")
+    for label, rows in SERIES_LENGTHS.items():
+        dataset = rng.random((rows, args.features))
+        for name, build in (("loop", loop_dataset), ("strided", strided_dataset)):
+            seconds, peak = measure(build, dataset, args.window, args.repeats)
+            print(f"{label:<18}{rows:>8}{name:>10}{seconds * 1000:>12.3f}{peak / 1024:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import forecasting
+import lstm_models
+import market_data
+import model_store
+from synthetic import synthetic_ohlcv
+
+TIME_STEP = 60
+
+# Stages reported by one train_lstm call
+def training_stages(data, ticker):
+    stages = []
+    forecasting.set_progress_callback(lambda update: stages.append(update["stage"]))
+    try:
+        lstm_models.train_lstm(data[["Close"]].values, data.index, TIME_STEP, ticker)
+    finally:
+        forecasting.set_progress_callback(None)
+    return set(stages)
+
+# Replay consecutive trading days through a rolling 3y window, as the app requests it, and check
+# that every one-bar refresh fine-tunes the stored model instead of retraining it
+def check_rolling_window(days):
+    bars = synthetic_ohlcv(900)
+    first_day = len(bars) - days
+    failures = []
+    with tempfile.TemporaryDirectory() as root:
+        model_store.MODEL_STORE_DIR = os.path.join(root, "models")
+        warehouse = market_data.WarehouseProvider(os.path.join(root, "warehouse"))
+        warehouse.write_history("CHECK", "1d", bars.iloc[:first_day])
+        training_stages(warehouse.history("CHECK", period="3y"), "CHECK")
+
+        for day in range(first_day, len(bars)):
+            # The day's bar is first seen partial, then completed
+            partial = bars.iloc[[day]].copy()
+            partial["Close"] = (partial["Open"] + partial["Close"]) / 2
+            for label, bar in (("partial", partial), ("completed", bars.iloc[[day]])):
+                warehouse.write_history("CHECK", "1d", bar)
+                window = warehouse.history("CHECK", period="3y")
+                stages = training_stages(window, "CHECK")
+                branch = "fine-tune" if "Fine-tuning LSTM" in stages else "retrain"
+                print(f"{window.index[-1].date()} {label:9s} rows={len(window)} first={window.index[0].date()} -> {branch}")
+                if branch != "fine-tune":
+                    failures.append((window.index[-1].date(), label))
+    return failures
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that rolling-window refreshes fine-tune stored LSTM models")
+    parser.add_argument("--days", type=int, default=5, help="Consecutive trading days to replay")
+    args = parser.parse_args()
+
+    failures = check_rolling_window(args.days)
+    for date, label in failures:
+        print(f"RETRAINED {date} ({label} bar)", file=sys.stderr)
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,137 @@
+import os
+import sys
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import news_feed
+
+# Local stand-in for the Yahoo Finance news pages: one page per ticker, served with an ETag that
+# changes with its headlines, or failing slowly with 503 for tickers marked as down
+class StubNewsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay):
+        super().__init__(("127.0.0.1", 0), StubNewsHandler)
+        self.delay = delay
+        self.pages = {}
+        self.down = set()
+        self.requests = 0
+        self.not_modified = 0
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def publish(self, ticker, headlines):
+        items = "".join(f'<li class="js-stream-content"><a href="/news/{i}"><h3>{title}</h3></a></li>'
+                        for i, title in enumerate(headlines))
+        self.pages[ticker] = (f'"{ticker}-{abs(hash(tuple(headlines)))}"', f"<html><body><ul>{items}</ul></body></html>")
+
+class StubNewsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.requests += 1
+        ticker = self.path.split("/")[2]
+        if ticker in server.down:
+            time.sleep(server.delay)
+            self.send_response(503)
+            self.end_headers()
+            return
+        etag, body = server.pages[ticker]
+        if self.headers.get("If-None-Match") == etag:
+            server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        payload = body.encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+def titles(items):
+    return [item["title"] for item in items]
+
+# Wait for background revalidations to finish
+def settle(feed):
+    while True:
+        with feed.lock:
+            if not feed.revalidating:
+                return
+        time.sleep(0.01)
+
+# Walk one feed through fresh hits, 304 revalidation, stale-while-revalidate and a failing upstream
+def check_news_feed(ttl, failure_ttl, delay):
+    server = StubNewsServer(delay)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    feed = news_feed.NewsFeed(base_url=server.base_url, ttl=ttl, stale_ttl=60, timeout=delay * 4, failure_ttl=failure_ttl)
+    failures = []
+
+    def check(label, passed):
+        print(f"{'ok  ' if passed else 'FAIL'} {label}")
+        if not passed:
+            failures.append(label)
+
+    try:
+        server.publish("AAA", ["First", "Second"])
+        check("miss fetches the page", titles(feed.ticker_news("AAA")) == ["First", "Second"] and server.requests == 1)
+        check("fresh entry is served without a request", titles(feed.ticker_news("AAA")) == ["First", "Second"] and server.requests == 1)
+
+        time.sleep(ttl)
+        feed.ticker_news("AAA")
+        settle(feed)
+        check("unchanged page revalidates with a 304", server.not_modified == 1 and feed.stats()["not_modified"] == 1)
+
+        server.publish("AAA", ["Breaking"])
+        time.sleep(ttl)
+        check("expired entry is served stale while revalidating", titles(feed.ticker_news("AAA")) == ["First", "Second"])
+        settle(feed)
+        check("revalidation picks up the changed page", titles(feed.ticker_news("AAA")) == ["Breaking"])
+
+        server.down.add("BBB")
+        started = time.perf_counter()
+        first = feed.ticker_news("BBB")
+        first_seconds = time.perf_counter() - started
+        requests = server.requests
+        started = time.perf_counter()
+        second = feed.ticker_news("BBB")
+        second_seconds = time.perf_counter() - started
+        print(f"     failing upstream: first call {first_seconds:.2f}s, repeat {second_seconds:.3f}s")
+        check("failed refresh falls back to no headlines", first == [] and second == [])
+        check("failure is cached instead of retried", server.requests == requests and second_seconds < delay / 2)
+
+        server.down.discard("BBB")
+        server.publish("BBB", ["Recovered"])
+        time.sleep(failure_ttl)
+        check("key is retried after the failure TTL", titles(feed.ticker_news("BBB")) == ["Recovered"])
+
+        server.down.add("AAA")
+        time.sleep(ttl)
+        feed.ticker_news("AAA")
+        settle(feed)
+        requests = server.requests
+        time.sleep(ttl)
+        check("stale entry outlives a failed revalidation", titles(feed.ticker_news("AAA")) == ["Breaking"])
+        settle(feed)
+        check("failed revalidation is not retried within the failure TTL", server.requests == requests)
+    finally:
+        server.shutdown()
+    print(feed.stats())
+    return failures
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the news feed cache against a local stub server")
+    parser.add_argument("--ttl", type=float, default=0.3, help="Fresh TTL in seconds")
+    parser.add_argument("--failure-ttl", type=float, default=1.0, help="Failure backoff in seconds")
+    parser.add_argument("--delay", type=float, default=0.5, help="Seconds the stub takes to fail")
+    args = parser.parse_args()
+
+    sys.exit(1 if check_news_feed(args.ttl, args.failure_ttl, args.delay) else 0)
@@ -0,0 +1,141 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import forecasting
+import figure_cache
+from synthetic import synthetic_ohlcv
+
+SERIES_LENGTHS = [252, 756, 2520]
+CHART_TYPES = ["Line Chart", "Candlestick", "OHLC", "Bar Chart"]
+FORECAST_DAYS = 30
+
+# Best-of-N wall time, then one traced run for peak Python/NumPy memory
+def measure(function, repeats):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 2**20, result
+
+def record(results, name, rows, seconds, peak_mb, **extra):
+    results.append({"name": name, "rows": rows, "seconds": seconds, "peak_mb": peak_mb, **extra})
+    print(f"{name:<48}{rows:>7}{seconds * 1000:>12.2f} ms{peak_mb:>10.2f} MiB", flush=True)
+
+def bench_models(results, data, model_types, repeats):
+    for model_type in model_types:
+        forecasting.get_forecaster(model_type)  # Keep backend import time out of the measurement
+        seconds, peak, _ = measure(lambda: forecasting.predict_stock_prices(data.copy(), FORECAST_DAYS, model_type), repeats)
+        record(results, f"predict_stock_prices[{model_type}]", len(data), seconds, peak)
+
+def bench_charts(results, data, repeats):
+    import app
+    future_dates, predictions = forecasting.predict_stock_prices(data.copy(), FORECAST_DAYS, "Linear Regression")
+    for fast in (False, True):
+        mode = ",fast" if fast else ""
+        for chart_type in CHART_TYPES:
+            cases = {
+                "generate_graph": lambda: app.generate_graph(data, chart_type, fast),
+                "generate_prediction_graph": lambda: app.generate_prediction_graph(future_dates, predictions, chart_type, fast),
+                "generate_combined_graph": lambda: app.generate_combined_graph(data, future_dates, predictions, chart_type, fast),
+            }
+            for name, build in cases.items():
+                # Streamlit serializes every figure to JSON, so that cost is part of the hot path
+                seconds, peak, payload = measure(lambda: build().to_json(), repeats)
+                record(results, f"{name}[{chart_type}{mode}]", len(data), seconds, peak, payload_bytes=len(payload))
+
+    # Rerun with unchanged inputs: the figure comes back from the serialized figure cache
+    cache = figure_cache.FigureCache()
+    for chart_type in CHART_TYPES:
+        cache.get_or_build(app.generate_combined_graph, data, future_dates, predictions, chart_type, False)
+        seconds, peak, _ = measure(
+            lambda: cache.get_or_build(app.generate_combined_graph, data, future_dates, predictions, chart_type, False).to_json(),
+            repeats)
+        record(results, f"figure_cache_hit[{chart_type}]", len(data), seconds, peak)
+
+def bench_risk(results, data, repeats):
+    import app
+    benchmark = synthetic_ohlcv(len(data), seed=1)
+    seconds, peak, _ = measure(lambda: app.calculate_risk(data, benchmark), repeats)
+    record(results, "calculate_risk", len(data), seconds, peak)
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "created_at": pd.Timestamp.now(tz="UTC").isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+# Print per-case timing ratios against a baseline run; returns the cases slower than threshold
+def compare(results, baseline_path, threshold):
+    with open(baseline_path, "r") as f:
+        baseline = {(entry["name"], entry["rows"]): entry for entry in json.load(f)["results"]}
+    regressions = []
+    print(f"\nCompared with {baseline_path} (threshold {threshold:.2f}x)")
+    for entry in results:
+        previous = baseline.get((entry["name"], entry["rows"]))
+        if previous is None or previous["seconds"] <= 0:
+            continue
+        ratio = entry["seconds"] / previous["seconds"]
+        flag = "REGRESSION" if ratio > threshold else ""
+        print(f"{entry['name']:<48}{entry['rows']:>7}{ratio:>9.2f}x  {flag}")
+        if flag:
+            regressions.append(entry)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark forecasting, charting and risk hot paths on synthetic OHLCV")
+    parser.add_argument("--lengths", type=int, nargs="+", default=SERIES_LENGTHS, help="Series lengths in bars")
+    parser.add_argument("--model", action="append", dest="models", choices=forecasting.MODEL_TYPES,
+                        help="Model to benchmark, repeatable (default: all)")
+    parser.add_argument("--skip", action="append", default=[], choices=["models", "charts", "risk"])
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per chart and risk case")
+    parser.add_argument("--model-repeats", type=int, default=1, help="Timed runs per model case")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    results = []
+    for rows in args.lengths:
+        data = synthetic_ohlcv(rows)
+        if "models" not in args.skip:
+            bench_models(results, data, args.models or forecasting.MODEL_TYPES, args.model_repeats)
+        if "charts" not in args.skip:
+            bench_charts(results, data, args.repeats)
+        if "risk" not in args.skip:
+            bench_risk(results, data, args.repeats)
+
+    with open(args.output, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        sys.exit(1 if compare(results, args.compare, args.threshold) else 0)
+
+if __name__ == "__main__":
+    main()
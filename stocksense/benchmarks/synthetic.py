@@ -0,0 +1,13 @@
+import numpy as np
+import pandas as pd
+
+# Deterministic OHLCV random walk shaped like yfinance daily history
+def synthetic_ohlcv(rows, seed=0, end="2025-03-20", tz="America/New_York"):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=end, periods=rows, tz=tz, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, rows)))
+    open_ = close * (1 + rng.normal(0, 0.004, rows))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.006, rows)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.006, rows)))
+    volume = rng.integers(1_000_000, 50_000_000, rows)
+    return pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume}, index=index)
@@ -0,0 +1,70 @@
+import os
+import numpy as np
+import pandas as pd
+
+# Point budgets for fast chart rendering; a chart a screen wide cannot show more than this anyway
+CHART_POINT_BUDGET = int(os.environ.get("STOCKSENSE_CHART_POINT_BUDGET", "1000"))
+CANDLE_BUDGET = int(os.environ.get("STOCKSENSE_CANDLE_BUDGET", "300"))
+
+# Coarser candle periods to try, finest first, with their nominal length
+CANDLE_PERIODS = [
+    ("5min", pd.Timedelta(minutes=5)),
+    ("15min", pd.Timedelta(minutes=15)),
+    ("1h", pd.Timedelta(hours=1)),
+    ("4h", pd.Timedelta(hours=4)),
+    ("1D", pd.Timedelta(days=1)),
+    ("W-FRI", pd.Timedelta(days=7)),
+    ("ME", pd.Timedelta(days=30)),
+    ("QE", pd.Timedelta(days=91)),
+    ("YE", pd.Timedelta(days=365)),
+]
+CANDLE_AGGREGATION = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+# Largest-Triangle-Three-Buckets: positions of `threshold` points that keep the visual shape of (x, y).
+# The first and last points are always kept; each bucket keeps the point forming the largest
+# triangle with the previously kept point and the average of the next bucket.
+def lttb_indices(x, y, threshold):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        area = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+# Downsample a price series for a line chart; returns (index, values)
+def downsample_line(index, values, max_points=CHART_POINT_BUDGET):
+    values = np.asarray(values, dtype=float)
+    if len(values) <= max_points:
+        return index, values
+    x = pd.DatetimeIndex(index).asi8 if isinstance(index, pd.DatetimeIndex) else np.arange(len(values))
+    keep = lttb_indices(x, values, max_points)
+    return index[keep], values[keep]
+
+# Merge bars into the finest calendar period that fits within `max_candles` candles
+def aggregate_candles(data, max_candles=CANDLE_BUDGET):
+    if len(data) <= max_candles:
+        return data
+    spacing = data.index.to_series().diff().median()
+    aggregation = {column: how for column, how in CANDLE_AGGREGATION.items() if column in data.columns}
+    candles = data
+    for rule, length in CANDLE_PERIODS:
+        if length <= spacing:
+            continue
+        candles = data.resample(rule).agg(aggregation).dropna(subset=["Close"])
+        if len(candles) <= max_candles:
+            break
+    return candles
@@ -0,0 +1,95 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import history_cache
+import quote_cache
+from batch_regression import align_closes
+
+# Comparison engine configuration
+COMPARE_WORKERS = int(os.environ.get("STOCKSENSE_COMPARE_WORKERS", "16"))
+COMPARE_PERIOD = "3y"
+TRADING_DAYS = 252
+
+# Call fetch(ticker) for every ticker on a thread pool; tickers that fail are left out
+def _fetch_all(fetch, tickers, workers):
+    def safe_fetch(ticker):
+        try:
+            return fetch(ticker)
+        except Exception:
+            return None
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tickers)))) as executor:
+        results = dict(zip(tickers, executor.map(safe_fetch, tickers)))
+    return {ticker: result for ticker, result in results.items() if result is not None}
+
+# Histories and info for every ticker, fetched concurrently; info comes through the shared quote cache,
+# so reruns of the comparison only reach upstream once the cached info expires
+def fetch_comparison_inputs(tickers, period=COMPARE_PERIOD, workers=COMPARE_WORKERS):
+    histories = _fetch_all(lambda ticker: history_cache.history(ticker, period=period), tickers, workers)
+    cached_infos = quote_cache.info_many(tickers)
+    infos = {ticker: cached_infos[ticker.upper()] for ticker in tickers if cached_infos[ticker.upper()] is not None}
+    return {ticker: data for ticker, data in histories.items() if not data.empty}, infos
+
+# Pairwise return statistics over the days both tickers traded, as (tickers x tickers) matrices:
+# correlation, and beta of the row ticker against the column ticker.
+# Missing days are masked out and every sum is a matrix product, so hundreds of tickers stay fast.
+def pairwise_statistics(returns):
+    observed = ~np.isnan(returns)
+    mask = observed.astype(float)
+    values = np.where(observed, returns, 0.0)
+
+    counts = mask.T @ mask
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # sums[i, j]: sum of i's returns over the days both i and j traded
+        sums = values.T @ mask
+        squares = (values ** 2).T @ mask
+        means = sums / counts
+        covariance = (values.T @ values) / counts - means * means.T
+        row_variance = squares / counts - means ** 2
+        column_variance = row_variance.T
+        correlation = covariance / np.sqrt(row_variance * column_variance)
+        beta = covariance / column_variance
+    return correlation, beta
+
+# Order tickers so that highly correlated ones sit next to each other (average-linkage clustering)
+def cluster_order(correlation):
+    if len(correlation) < 3:
+        return list(correlation.index)
+    # Imported here: scipy.cluster is only needed for the heatmap and is slow to import with the app
+    from scipy.cluster.hierarchy import linkage, leaves_list
+    from scipy.spatial.distance import squareform
+    distance = np.sqrt(np.clip((1 - correlation.fillna(0).to_numpy()) / 2, 0, 1))
+    np.fill_diagonal(distance, 0)
+    order = leaves_list(linkage(squareform(distance, checks=False), method="average"))
+    return list(correlation.index[order])
+
+# Compare tickers side by side: summary table plus return correlation and pairwise beta matrices
+def compare(tickers, period=COMPARE_PERIOD, workers=COMPARE_WORKERS):
+    histories, infos = fetch_comparison_inputs(tickers, period, workers)
+    if not histories:
+        return {"table": pd.DataFrame(), "correlation": pd.DataFrame(), "beta": pd.DataFrame()}
+
+    closes, _ = align_closes(histories)
+    prices = closes.to_numpy(dtype=float)
+    first = closes.bfill().iloc[0].to_numpy()
+    last = closes.ffill().iloc[-1].to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = prices[1:] / prices[:-1] - 1
+    volatility = np.nanstd(returns, axis=0, ddof=1) * np.sqrt(TRADING_DAYS)
+    correlation, beta = pairwise_statistics(returns)
+
+    columns = list(closes.columns)
+    table = pd.DataFrame({
+        "Ticker": columns,
+        "Current Price": [infos.get(ticker, {}).get('currentPrice', 'N/A') for ticker in columns],
+        "Industry": [infos.get(ticker, {}).get('industry', 'N/A') for ticker in columns],
+        "Volume": [infos.get(ticker, {}).get('regularMarketVolume', 'N/A') for ticker in columns],
+        "Beta": [infos.get(ticker, {}).get('beta', 'N/A') for ticker in columns],
+        "3Y Growth (%)": (last - first) / first * 100,
+        "Volatility (%)": volatility * 100,
+    })
+    return {
+        "table": table,
+        "correlation": pd.DataFrame(correlation, index=columns, columns=columns),
+        "beta": pd.DataFrame(beta, index=columns, columns=columns),
+    }
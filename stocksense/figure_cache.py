@@ -0,0 +1,86 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+
+# Figure cache configuration
+FIGURE_CACHE_MAX_BYTES = int(os.environ.get("STOCKSENSE_FIGURE_CACHE_MAX_BYTES", str(64 * 2**20)))
+
+# Stable hash of chart inputs: frames and arrays by content, everything else by repr
+def inputs_fingerprint(*inputs):
+    digest = hashlib.sha1()
+    for value in inputs:
+        if isinstance(value, list) and value and isinstance(value[0], pd.Timestamp):
+            value = pd.DatetimeIndex(value)
+        if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+            digest.update(pd.util.hash_pandas_object(value).values.tobytes())
+        elif isinstance(value, (np.ndarray, list)):
+            digest.update(np.ascontiguousarray(value, dtype=float).tobytes())
+        else:
+            digest.update(repr(value).encode())
+        digest.update(b"|")
+    return digest.hexdigest()
+
+# Figure rebuilt from its JSON without re-running Plotly's property validation.
+# It already holds plain JSON values, so serializing it again for the browser is cheap.
+def figure_from_json(payload):
+    return go.Figure(json.loads(payload), _validate=False)
+
+# Bounded LRU of serialized figures keyed by chart builder and a fingerprint of its inputs.
+# Memory is bounded by the total size of the stored JSON rather than the entry count.
+class FigureCache:
+    def __init__(self, max_bytes=FIGURE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Figure for build(*args), built and serialized only when these inputs were not seen before
+    def get_or_build(self, build, *args):
+        key = (build.__name__, inputs_fingerprint(*args))
+        with self.lock:
+            payload = self.entries.get(key)
+            if payload is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if payload is None:
+            payload = build(*args).to_json()
+            self.put(key, payload)
+        return figure_from_json(payload)
+
+    def put(self, key, payload):
+        with self.lock:
+            if key in self.entries:
+                self.size -= len(self.entries.pop(key))
+            if len(payload) > self.max_bytes:
+                return
+            self.entries[key] = payload
+            self.size += len(payload)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
@@ -5,31 +5,26 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
-import json
-import os
 import time
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import random
-
-# User data file
-USER_DATA_FILE = "users.json"
+import market_snapshot
+import news_feed
+import user_store
+import quote_cache
+import single_flight
 
 # Email configuration (Replace with your email and password)
 EMAIL_ADDRESS = "tradesense2003@gmail.com"  # Replace with your Gmail email
 EMAIL_PASSWORD = "bows negp rtlt ngqs"  # Replace with your Gmail app-specific password
 
-# Load/save users
-def load_users():
-    if os.path.exists(USER_DATA_FILE):
-        with open(USER_DATA_FILE, 'r') as f:
-            return json.load(f)
-    return {}
-
-def save_users(users):
-    with open(USER_DATA_FILE, 'w') as f:
-        json.dump(users, f)
+# Logged-in user's record, loaded once per session; replaced with the store's copy after each change
+def current_user():
+    if st.session_state.user_data is None and st.session_state.username:
+        st.session_state.user_data = user_store.get_user_store().get_user(st.session_state.username)
+    return st.session_state.user_data or {}
 
 # Send email function
 def send_email(to_email, subject, body):
@@ -55,7 +50,7 @@ def initialize_session_state():
         'logged_in': False,
         'username': "",
         'email': "",
-        'users': load_users(),
+        'user_data': None,
         'candle_data': pd.DataFrame(columns=["time", "open", "high", "low", "close"]),
         'trading_active': False,
         'symbol': "AAPL",
@@ -63,8 +58,6 @@ def initialize_session_state():
         'sold_price': {},
         'bought_price': {},
         'last_update_time': 0,
-        'stock_data_cache': {},
-        'company_name_cache': {},
         'portfolio_history': [],
         'current_price': 0.0,
         'market_news': [],
@@ -94,15 +87,10 @@ def preload_data():
         st.session_state.market_news = fetch_market_news()
         st.session_state.market_movers = fetch_market_movers()
 
-# Fetch stock data from yfinance with caching
+# Fetch stock data through the process-wide quote cache
 def get_stock_data(symbol, period="1d", interval="1m"):
-    cache_key = f"{symbol}_{period}_{interval}"
-    if cache_key in st.session_state.stock_data_cache:
-        return st.session_state.stock_data_cache[cache_key]
-
     try:
-        stock = yf.Ticker(symbol)
-        df = stock.history(period=period, interval=interval)
+        df = quote_cache.history(symbol, period=period, interval=interval)
         if df.empty:
             df = pd.DataFrame([{
                 "time": datetime.now(),
@@ -113,7 +101,6 @@ def get_stock_data(symbol, period="1d", interval="1m"):
             }])
         else:
             df = df.reset_index().rename(columns={"Datetime": "time", "Open": "open", "High": "high", "Low": "low", "Close": "close"})
-        st.session_state.stock_data_cache[cache_key] = df
         return df
     except Exception:
         return pd.DataFrame([{
@@ -124,28 +111,19 @@ def get_stock_data(symbol, period="1d", interval="1m"):
             "close": 100.2
         }])
 
-# Fetch company name with caching
+# Fetch company name through the process-wide quote cache
 def get_company_name(symbol):
-    if symbol in st.session_state.company_name_cache:
-        return st.session_state.company_name_cache[symbol]
-
     try:
-        stock = yf.Ticker(symbol)
-        info = stock.info
-        company_name = info.get("longName", "Unknown Company")
-        st.session_state.company_name_cache[symbol] = company_name
-        return company_name
+        return quote_cache.info(symbol).get("longName", "Unknown Company")
     except Exception:
-        st.session_state.company_name_cache[symbol] = "Unknown Company"
         return "Unknown Company"
 
 # Fetch current price for a symbol
 def get_current_price(symbol):
     try:
-        stock = yf.Ticker(symbol)
-        data = stock.history(period="1d", interval="1m")
+        data = quote_cache.history(symbol, period="1d", interval="1m")
         if not data.empty:
-            return round(data["Close"][-1], 2)
+            return round(data["Close"].iloc[-1], 2)
         return 0.0
     except Exception:
         return 0.0
@@ -165,8 +143,8 @@ def fetch_market_news():
         "Automakers pivot to EVs, boosting shares. 🚗"
     ]
     try:
-        sp500 = yf.Ticker("^GSPC")
-        news = sp500.news[:5]
+        # Cached for the news feed TTL; the page polls every few seconds
+        news = news_feed.get_news_feed().cached("^GSPC", lambda: yf.Ticker("^GSPC").news[:5])
         news_items = [item["title"] for item in news]
         if not news_items:
             return random.sample(news_options, 5)
@@ -174,99 +152,46 @@ def fetch_market_news():
     except Exception:
         return random.sample(news_options, 5)
 
-# Fetch market movers (only Top Gainers) with optimization
+# Fetch market movers (only Top Gainers) from the scheduler's snapshot, computing them inline when none is fresh
 def fetch_market_movers():
-    symbols = ["AAPL", "TSLA", "NVDA", "META", "GOOGL", "MSFT", "AMZN", "AMD", "INTC", "PYPL"]
-    gainers = []
-    for symbol in symbols:
-        try:
-            stock = yf.Ticker(symbol)
-            data = stock.history(period="1d")
-            if not data.empty:
-                change = ((data["Close"][-1] - data["Open"][0]) / data["Open"][0]) * 100
-                change = round(change, 2)
-                if change >= 0:
-                    gainers.append({"symbol": symbol, "change": change})
-        except Exception:
-            continue
-    gainers = sorted(gainers, key=lambda x: x["change"], reverse=True)[:5]
-    if not gainers:
-        gainers = [{"symbol": f"GAINER{i}", "change": 3.5 - i*0.2} for i in range(5)]
-    return {"gainers": gainers}
-
-# Fetch recent data for selected stocks with optimization
-def fetch_recent_data():
-    symbols = ["AAPL", "TSLA", "GOOGL", "MSFT", "AMZN", "NVDA", "META", "AMD", "INTC", "PYPL"]
-    data_list = []
-    for symbol in symbols:
-        try:
-            stock = yf.Ticker(symbol)
-            data = stock.history(period="1d", interval="1m")
-            info = stock.info
-            if not data.empty:
-                latest = data.iloc[-1]
-                change = ((latest["Close"] - data.iloc[0]["Open"]) / data.iloc[0]["Open"]) * 100
-                data_list.append({
-                    "Symbol": symbol,
-                    "Company": info.get("longName", "Unknown Company"),
-                    "Price": round(latest["Close"], 2),
-                    "Volume": int(latest["Volume"]),
-                    "Change %": round(change, 2),
-                    "52w high": round(info.get("fiftyTwoWeekHigh", 0), 2),
-                    "52w low": round(info.get("fiftyTwoWeekLow", 0), 2),
-                    "Market cap (B)": round(info.get("marketCap", 0) / 1e9, 2),
-                    "P/e ratio": round(info.get("trailingPE", 0), 2),
-                    "Dividend yield": round(info.get("dividendYield", 0) * 100, 2) if info.get("dividendYield") else 0.0,
-                    "Eps": round(info.get("trailingEps", 0), 2)
-                })
-        except Exception:
-            data_list.append({
-                "Symbol": symbol,
-                "Company": "Unknown Company",
-                "Price": 100.0,
-                "Volume": 1000000,
-                "Change %": 0.0,
-                "52w high": 110.0,
-                "52w low": 90.0,
-                "Market cap (B)": 100.0,
-                "P/e ratio": 15.0,
-                "Dividend yield": 1.5,
-                "Eps": 5.0
-            })
-    df = pd.DataFrame(data_list)
-    df.index = range(1, len(df) + 1)
-    return df
+    snapshot = market_snapshot.load_latest()
+    if snapshot is not None:
+        return snapshot["market_movers"]
+    return market_snapshot.compute_market_movers()
 
-# Fetch watchlist data with real-time updates
+# Fetch recent data for selected stocks from the scheduler's snapshot, computing it inline when none is fresh
+def fetch_recent_data():
+    snapshot = market_snapshot.load_latest()
+    if snapshot is not None:
+        return market_snapshot.recent_data_frame(snapshot["recent_data"])
+    return market_snapshot.recent_data_frame(market_snapshot.compute_recent_data())
+
+# Placeholder row for watchlist symbols that could not be fetched
+WATCHLIST_FALLBACK = {
+    "Company name": "Unknown Company",
+    "Price": 100.0,
+    "Volume": 1000000,
+    "Industry": "N/A",
+    "Market cap": 100.0,
+    "P/e ratio": 15.0
+}
+
+# Fetch watchlist data with one bulk bar download and concurrent cached info lookups
 def fetch_watchlist_data(symbols):
-    data_list = []
-    for symbol in symbols:
-        try:
-            stock = yf.Ticker(symbol)
-            data = stock.history(period="1d", interval="1m")
-            info = stock.info
-            if not data.empty:
-                latest = data.iloc[-1]
-                data_list.append({
-                    "Ticker symbol": symbol,
-                    "Company name": info.get("longName", "Unknown Company"),
-                    "Price": round(latest["Close"], 2),
-                    "Volume": int(latest["Volume"]),
-                    "Industry": info.get("industry", "N/A"),
-                    "Market cap": round(info.get("marketCap", 0) / 1e9, 2),
-                    "P/e ratio": round(info.get("trailingPE", 0), 2)
-                })
-        except Exception:
-            data_list.append({
-                "Ticker symbol": symbol,
-                "Company name": "Unknown Company",
-                "Price": 100.0,
-                "Volume": 1000000,
-                "Industry": "N/A",
-                "Market cap": 100.0,
-                "P/e ratio": 15.0
-            })
-    df = pd.DataFrame(data_list)
+    symbols = [symbol.upper() for symbol in symbols]
+    quotes, failed = quote_cache.quote_frame(
+        symbols, {"longName": "Unknown Company", "industry": "N/A", "marketCap": 0, "trailingPE": 0}
+    )
+    df = pd.DataFrame({
+        "Ticker symbol": quotes.index,
+        "Company name": quotes["longName"],
+        "Price": quotes["close"].round(2),
+        "Volume": quotes["volume"].fillna(0).astype(int),
+        "Industry": quotes["industry"],
+        "Market cap": (quotes["marketCap"] / 1e9).round(2),
+        "P/e ratio": quotes["trailingPE"].round(2)
+    })
+    df = quote_cache.with_fallback_rows(df, "Ticker symbol", failed, WATCHLIST_FALLBACK, symbols)
     df.index = range(1, len(df) + 1)
     return df
 
@@ -304,7 +229,7 @@ def update_candle_data(symbol):
 def check_price_alerts():
     if not st.session_state.logged_in:
         return
-    user_data = st.session_state.users.get(st.session_state.username, {})
+    user_data = current_user()
     if not user_data:
         return
     email = user_data.get("email", "")
@@ -334,10 +259,11 @@ The TradeRiser Team 🌟
 """
             send_email(email, subject, body)
             alerts_to_remove.append(alert)
-    for alert in alerts_to_remove:
-        st.session_state.price_alerts.remove(alert)
-    user_data["price_alerts"] = st.session_state.price_alerts
-    save_users(st.session_state.users)
+    if alerts_to_remove:
+        for alert in alerts_to_remove:
+            st.session_state.price_alerts.remove(alert)
+        st.session_state.user_data = user_store.get_user_store().set_price_alerts(
+            st.session_state.username, st.session_state.price_alerts)
 
 # Login Page
 def login():
@@ -853,12 +779,13 @@ def login():
     st.markdown('</div>', unsafe_allow_html=True)
 
     if login_btn:
-        users = st.session_state.users
-        if username in users and users[username]["password"] == password:
+        user = user_store.get_user_store().get_user(username)
+        if user is not None and user["password"] == password:
             st.session_state.logged_in = True
             st.session_state.username = username
-            st.session_state.email = users[username]["email"]
-            st.session_state.price_alerts = users[username].get("price_alerts", [])
+            st.session_state.user_data = user
+            st.session_state.email = user["email"]
+            st.session_state.price_alerts = user.get("price_alerts", [])
             st.success("Welcome back, trader! 🚀")
             st.rerun()
         else:
@@ -995,27 +922,17 @@ def register():
     st.markdown('</div>', unsafe_allow_html=True)
 
     if register_btn:
-        users = st.session_state.users
-        if username in users:
-            st.error("Username already exists! 🚫")
-        elif password != confirm_password:
+        store = user_store.get_user_store()
+        if password != confirm_password:
             st.error("Passwords do not match! ⚠️")
         elif not email:
             st.error("Please provide an email address! 📧")
+        elif not store.create_user(username, password, email):
+            st.error("Username already exists! 🚫")
         else:
-            users[username] = {
-                "password": password,
-                "email": email,
-                "balance": 10000.0,
-                "portfolio": {},
-                "watchlist": [],
-                "transactions": [],
-                "price_alerts": []
-            }
-            save_users(users)
-            st.session_state.users = users
             st.session_state.logged_in = True
             st.session_state.username = username
+            st.session_state.user_data = store.get_user(username)
             st.session_state.email = email
             st.session_state.price_alerts = []
             # Send welcome email
@@ -1044,6 +961,7 @@ The TradeRiser Team 🌟
 def logout():
     st.session_state.logged_in = False
     st.session_state.username = ""
+    st.session_state.user_data = None
     st.session_state.email = ""
     st.session_state.trading_active = False
     st.session_state.candle_data = pd.DataFrame(columns=["time", "open", "high", "low", "close"])
@@ -1101,8 +1019,8 @@ def calculate_portfolio_stats(user_data):
 
 # Main App
 def main_app():
-    users = st.session_state.users
-    user_data = users.get(st.session_state.username, {})
+    store = user_store.get_user_store()
+    user_data = current_user()
     if not user_data:
         st.error("User data not found. Please log in again.")
         return
@@ -1408,6 +1326,12 @@ def main_app():
     choice = st.sidebar.selectbox("Menu", menu)
     if st.sidebar.button("Logout 🚪"):
         logout()
+    quote_stats = quote_cache.get_quote_cache().stats()
+    st.sidebar.caption(
+        f"Quote cache: {quote_stats['entries']} entries, {quote_stats['hits']} hits, "
+        f"{quote_stats['misses']} misses, {quote_stats['evictions']} evictions, "
+        f"{single_flight.stats()['deduplicated']} upstream calls deduplicated"
+    )
 
     # Check Price Alerts
     check_price_alerts()
@@ -1421,8 +1345,7 @@ def main_app():
 
         # Additional Content: Quick Info Cards
         current_price = st.session_state.current_price if st.session_state.current_price > 0 else get_current_price(symbol)
-        stock = yf.Ticker(symbol)
-        info = stock.info
+        info = quote_cache.info(symbol)
         st.markdown("""
             <div class="dashboard-info">
                 <div class="info-card">
@@ -1493,26 +1416,19 @@ def main_app():
                 if price <= 0:
                     st.error("Cannot buy: Current price is zero! 🚫")
                 else:
-                    total_cost = price * quantity
-                    if total_cost <= user_data["balance"]:
-                        user_data["balance"] -= total_cost
-                        if symbol in user_data["portfolio"]:
-                            current_qty = user_data["portfolio"][symbol]["quantity"]
-                            current_avg = user_data["portfolio"][symbol]["avg_price"]
-                            user_data["portfolio"][symbol]["quantity"] += quantity
-                            user_data["portfolio"][symbol]["avg_price"] = (
-                                (current_avg * current_qty + price * quantity) / (current_qty + quantity)
-                            )
-                        else:
-                            user_data["portfolio"][symbol] = {"quantity": quantity, "avg_price": price}
-                        user_data["transactions"].append({
-                            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            "symbol": symbol, "action": "Buy", "quantity": quantity, "price": price, "total": total_cost
-                        })
+                    # Balance check, position update and ledger entry commit together
+                    try:
+                        updated = store.buy(st.session_state.username, symbol, quantity, price)
+                    except OSError as e:
+                        # Placed but not yet on disk: the store keeps it and retries the write, so show it as
+                        # placed rather than let a second click buy again
+                        updated = store.get_user(st.session_state.username)
+                        st.warning(f"Trade placed, but saving it is delayed ({e}). It will be saved automatically. ⏳")
+                    if updated is not None:
+                        user_data = st.session_state.user_data = updated
                         st.session_state.bought_price[symbol] = price
                         st.session_state.current_price = price
                         st.session_state.buy_message = f"Bought {quantity} shares at ${price:.2f}"
-                        save_users(users)
                     else:
                         st.error("Insufficient funds! 🚫")
         with col2:
@@ -1521,20 +1437,16 @@ def main_app():
                 if price <= 0:
                     st.error("Cannot sell: Current price is zero! 🚫")
                 else:
-                    if symbol in user_data["portfolio"] and user_data["portfolio"][symbol]["quantity"] >= quantity:
-                        total_cost = price * quantity
-                        user_data["portfolio"][symbol]["quantity"] -= quantity
-                        user_data["balance"] += total_cost
-                        if user_data["portfolio"][symbol]["quantity"] == 0:
-                            del user_data["portfolio"][symbol]
-                        user_data["transactions"].append({
-                            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            "symbol": symbol, "action": "Sell", "quantity": quantity, "price": price, "total": total_cost
-                        })
+                    try:
+                        updated = store.sell(st.session_state.username, symbol, quantity, price)
+                    except OSError as e:
+                        updated = store.get_user(st.session_state.username)
+                        st.warning(f"Trade placed, but saving it is delayed ({e}). It will be saved automatically. ⏳")
+                    if updated is not None:
+                        user_data = st.session_state.user_data = updated
                         st.session_state.sold_price[symbol] = price
                         st.session_state.current_price = price
                         st.session_state.sell_message = f"Sold {quantity} shares at ${price:.2f}"
-                        save_users(users)
                     else:
                         st.error("Not enough shares! 🚫")
 
@@ -1632,8 +1544,7 @@ def main_app():
         new_symbol = st.text_input("Add Symbol ➕").upper()
         if st.button("Add ➕"):
             if new_symbol and new_symbol not in user_data["watchlist"]:
-                user_data["watchlist"].append(new_symbol)
-                save_users(users)
+                user_data = st.session_state.user_data = store.add_to_watchlist(st.session_state.username, new_symbol)
                 st.success(f"{new_symbol} added to watchlist! ✅")
 
         if user_data["watchlist"]:
@@ -1667,12 +1578,10 @@ def main_app():
             if new_password and new_password != confirm_password:
                 st.error("Passwords do not match! ⚠️")
             else:
+                user_data = st.session_state.user_data = store.update_profile(
+                    st.session_state.username, email=new_email, password=new_password)
                 if new_email:
-                    user_data["email"] = new_email
                     st.session_state.email = new_email
-                if new_password:
-                    user_data["password"] = new_password
-                save_users(users)
                 st.success("Profile updated successfully! ✅")
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -1852,8 +1761,7 @@ The TradeRiser Team 🌟
         target_price = st.number_input("Target price 🎯", min_value=0.0, value=150.0)
         if st.button("Set Alert 🔔"):
             st.session_state.price_alerts.append({"symbol": alert_symbol, "target_price": target_price})
-            user_data["price_alerts"] = st.session_state.price_alerts
-            save_users(users)
+            user_data = st.session_state.user_data = store.set_price_alerts(st.session_state.username, st.session_state.price_alerts)
             st.success(f"Alert set for {alert_symbol} at ${target_price:.2f}! 🔔")
 
         if st.session_state.price_alerts:
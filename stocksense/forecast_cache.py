@@ -0,0 +1,76 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+import pandas as pd
+
+# Forecast cache configuration
+FORECAST_CACHE_SIZE = int(os.environ.get("STOCKSENSE_FORECAST_CACHE_SIZE", "256"))
+# Horizons forecasts are computed for; a request is served from the smallest that covers it
+FORECAST_HORIZONS = (30, 90, 180, 365)
+
+# Stable hash of the price history a forecast was computed from
+def data_fingerprint(data):
+    hashed = pd.util.hash_pandas_object(data["Close"], index=True)
+    return hashlib.sha1(hashed.values.tobytes()).hexdigest()
+
+# Horizon to compute for a request of `days`
+def horizon_for(days):
+    return next((horizon for horizon in FORECAST_HORIZONS if horizon >= days), days)
+
+# Bounded LRU of forecasts keyed by (ticker, model, data fingerprint).
+# Each entry holds the longest horizon computed so far; shorter requests are sliced from it.
+class ForecastCache:
+    def __init__(self, max_entries=FORECAST_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Cached forecast sliced to `days`, or None. Callers that poll for a result
+    # pass record_miss=False and call record_miss() once when they start computing.
+    def get(self, ticker, model_type, fingerprint, days, record_miss=True):
+        key = (ticker, model_type, fingerprint)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry["horizon"] < days:
+                if record_miss:
+                    self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry["future_dates"][:days], entry["predictions"][:days]
+
+    def record_miss(self):
+        with self.lock:
+            self.misses += 1
+
+    def put(self, ticker, model_type, fingerprint, future_dates, predictions):
+        key = (ticker, model_type, fingerprint)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry["horizon"] < len(future_dates):
+                self.entries[key] = {
+                    "horizon": len(future_dates),
+                    "future_dates": list(future_dates),
+                    "predictions": predictions,
+                }
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
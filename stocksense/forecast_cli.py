@@ -0,0 +1,128 @@
+import os
+import sys
+import argparse
+import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pyarrow as pa
+import pyarrow.parquet as pq
+import forecasting
+import history_cache
+
+# Long-format output: one row per ticker and forecast day
+FORECAST_SCHEMA = pa.schema([
+    ("ticker", pa.string()),
+    ("model", pa.string()),
+    ("run_at", pa.timestamp("s", tz="UTC")),
+    ("last_close_date", pa.date32()),
+    ("last_close", pa.float64()),
+    ("horizon_day", pa.int16()),
+    ("date", pa.date32()),
+    ("predicted_close", pa.float64()),
+])
+
+# Read tickers from a file: one per line, blank lines and # comments ignored
+def read_tickers(path):
+    tickers = []
+    with open(path, "r") as f:
+        for line in f:
+            ticker = line.split("#", 1)[0].strip().upper()
+            if ticker and ticker not in tickers:
+                tickers.append(ticker)
+    return tickers
+
+# Runs in a worker process
+def forecast_ticker(ticker, data, days, model_type):
+    future_dates, predictions = forecasting.predict_stock_prices(data, days, model_type, ticker)
+    return {
+        "ticker": ticker,
+        "last_close_date": data.index[-1].date(),
+        "last_close": float(data["Close"].iloc[-1]),
+        "future_dates": [date.date() for date in future_dates],
+        "predictions": [float(price) for price in predictions],
+    }
+
+def forecast_rows(result, model_type, run_at):
+    days = len(result["predictions"])
+    return {
+        "ticker": [result["ticker"]] * days,
+        "model": [model_type] * days,
+        "run_at": [run_at] * days,
+        "last_close_date": [result["last_close_date"]] * days,
+        "last_close": [result["last_close"]] * days,
+        "horizon_day": list(range(1, days + 1)),
+        "date": result["future_dates"],
+        "predicted_close": result["predictions"],
+    }
+
+# Forecast every ticker in parallel workers and stream the results into a Parquet file.
+# Histories are read through the incremental cache in this process while workers fit models.
+def run_batch(tickers, output, model_type, days, period="3y", workers=None, batch_size=50):
+    run_at = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    failures = {}
+    written = 0
+    pending_rows = []
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=forecasting.mark_batch_worker) as executor, \
+            pq.ParquetWriter(output, FORECAST_SCHEMA) as writer:
+        futures = {}
+        for ticker in tickers:
+            try:
+                data = history_cache.history(ticker, period=period)
+            except Exception as e:
+                failures[ticker] = f"history: {e}"
+                continue
+            if data.empty:
+                failures[ticker] = "no history"
+                continue
+            futures[executor.submit(forecast_ticker, ticker, data, days, model_type)] = ticker
+
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                pending_rows.append(forecast_rows(future.result(), model_type, run_at))
+            except Exception as e:
+                failures[ticker] = str(e)
+                continue
+            written += 1
+            if len(pending_rows) >= batch_size:
+                writer.write_table(_rows_to_table(pending_rows))
+                pending_rows = []
+            print(f"[{written + len(failures)}/{len(tickers)}] {ticker}", file=sys.stderr)
+        if pending_rows:
+            writer.write_table(_rows_to_table(pending_rows))
+    return written, failures
+
+def _rows_to_table(row_groups):
+    columns = {name: [] for name in FORECAST_SCHEMA.names}
+    for rows in row_groups:
+        for name in columns:
+            columns[name].extend(rows[name])
+    return pa.Table.from_pydict(columns, schema=FORECAST_SCHEMA)
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute stock price forecasts for a ticker list into Parquet")
+    parser.add_argument("tickers_file", help="File with one ticker symbol per line")
+    parser.add_argument("output", help="Parquet file to write")
+    parser.add_argument("--model", default="Linear Regression", choices=forecasting.MODEL_TYPES, help="Prediction model")
+    parser.add_argument("--days", type=int, default=30, help="Days to predict (1-365)")
+    parser.add_argument("--period", default="3y", help="History period to train on (default: 3y)")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1), help="Worker processes")
+    parser.add_argument("--batch-size", type=int, default=50, help="Tickers per Parquet row group")
+    args = parser.parse_args()
+
+    if not 1 <= args.days <= 365:
+        parser.error("--days must be between 1 and 365")
+    tickers = read_tickers(args.tickers_file)
+    if not tickers:
+        parser.error(f"No tickers found in {args.tickers_file}")
+
+    written, failures = run_batch(tickers, args.output, args.model, args.days, args.period, args.workers, args.batch_size)
+    for ticker, error in failures.items():
+        print(f"FAILED {ticker}: {error}", file=sys.stderr)
+    print(f"Wrote {written} of {len(tickers)} forecasts to {args.output}")
+    sys.exit(1 if written == 0 else 0)
+
+if __name__ == "__main__":
+    main()
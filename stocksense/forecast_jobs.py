@@ -0,0 +1,165 @@
+import os
+import time
+import uuid
+import threading
+import multiprocessing
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+import forecasting
+import forecast_cache
+
+# Forecast job configuration
+FORECAST_WORKERS = int(os.environ.get("STOCKSENSE_FORECAST_WORKERS", str(max(1, min(4, (os.cpu_count() or 2) - 1)))))
+# Seconds a failed forecast is reported to waiting sessions before it may be retried
+FORECAST_FAILURE_TTL = int(os.environ.get("STOCKSENSE_FORECAST_FAILURE_TTL", "60"))
+
+# Runs in a worker process: forward backend progress into the shared progress table
+def _run_forecast(job_id, data, days, model_type, ticker, progress_table):
+    def publish(update):
+        progress_table[job_id] = update
+    forecasting.set_progress_callback(publish)
+    try:
+        return forecasting.predict_stock_prices(data, days, model_type, ticker)
+    finally:
+        forecasting.set_progress_callback(None)
+
+# Process-pool forecast queue shared by every session in this server process.
+# Identical in-flight requests (same ticker, model, data and horizon) share one
+# job, and finished forecasts land in a ForecastCache that serves all sessions.
+# Jobs that write the same stored model (forecasting.store_family) run one after another.
+class ForecastJobQueue:
+    def __init__(self, max_workers=FORECAST_WORKERS, failure_ttl=FORECAST_FAILURE_TTL, cache=None):
+        # Spawned workers avoid inheriting TensorFlow state through fork
+        context = multiprocessing.get_context("spawn")
+        self.executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+        self.manager = context.Manager()
+        self.progress_table = self.manager.dict()
+        self.cache = cache or forecast_cache.ForecastCache()
+        self.failure_ttl = failure_ttl
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.in_flight = {}
+        # Latest job per stored-model family; the next job for that family starts when it finishes
+        self.store_jobs = {}
+        self.closed = False
+
+    # Serve a forecast from the cache, or start/join the background job computing it
+    def request(self, data, days, model_type, ticker):
+        fingerprint = forecast_cache.data_fingerprint(data)
+        cached = self.cache.get(ticker, model_type, fingerprint, days, record_miss=False)
+        if cached is not None:
+            return {"state": "done", "result": cached}
+        horizon = forecast_cache.horizon_for(days)
+        status = self.status(self.submit(data, horizon, model_type, ticker, fingerprint))
+        if status["state"] == "unknown":
+            # The job finished and was cleaned up in between; its result is in the cache
+            cached = self.cache.get(ticker, model_type, fingerprint, days, record_miss=False)
+            status = {"state": "done", "result": cached} if cached is not None else self.request(data, days, model_type, ticker)
+        elif status["state"] == "done":
+            future_dates, predictions = status["result"]
+            status["result"] = (future_dates[:days], predictions[:days])
+        return status
+
+    # Submit a forecast, or return the id of an identical queued, running or recently failed job
+    def submit(self, data, days, model_type, ticker, fingerprint=None):
+        fingerprint = fingerprint or forecast_cache.data_fingerprint(data)
+        key = (ticker, model_type, fingerprint, days)
+        with self.lock:
+            self._expire_failures()
+            if key in self.in_flight:
+                return self.in_flight[key]
+
+            self.cache.record_miss()
+            job_id = uuid.uuid4().hex
+            family = forecasting.store_family(model_type, ticker)
+            previous = self.store_jobs.get(family)
+            if previous is None or previous.done():
+                future = self._start(job_id, data, days, model_type, ticker)
+            else:
+                # Another job is training this stored model: queue behind it so neither overwrites the other
+                future = Future()
+                previous.add_done_callback(lambda _: self._start_queued(future, job_id, data, days, model_type, ticker))
+            if family is not None:
+                self.store_jobs[family] = future
+            self.jobs[job_id] = {"key": key, "future": future, "submitted_at": time.time()}
+            self.in_flight[key] = job_id
+        future.add_done_callback(lambda done: self._finish(job_id, key, done, family))
+        return job_id
+
+    def _start(self, job_id, data, days, model_type, ticker):
+        return self.executor.submit(_run_forecast, job_id, data, days, model_type, ticker, self.progress_table)
+
+    # Start a job that waited for its stored-model family and forward its outcome to the placeholder future
+    def _start_queued(self, queued, job_id, data, days, model_type, ticker):
+        if not queued.set_running_or_notify_cancel():
+            return
+        try:
+            started = self._start(job_id, data, days, model_type, ticker)
+        except Exception as e:  # Pool already shut down
+            queued.set_exception(e)
+            return
+        def forward(done):
+            if done.cancelled():
+                queued.set_exception(CancelledError())
+            elif done.exception() is not None:
+                queued.set_exception(done.exception())
+            else:
+                queued.set_result(done.result())
+        started.add_done_callback(forward)
+
+    def _finish(self, job_id, key, future, family=None):
+        ticker, model_type, fingerprint, _ = key
+        with self.lock:
+            if self.store_jobs.get(family) is future:
+                del self.store_jobs[family]
+            if future.cancelled():
+                # Cancelled at shutdown: nobody can wait for it, and exception() would raise
+                self.jobs.pop(job_id, None)
+                self.in_flight.pop(key, None)
+                return
+        if future.exception() is None:
+            self.cache.put(ticker, model_type, fingerprint, *future.result())
+        with self.lock:
+            # Failed jobs stay joinable until failure_ttl so waiting sessions can read the error
+            if future.exception() is None:
+                self.in_flight.pop(key, None)
+            else:
+                self.jobs[job_id]["finished_at"] = time.time()
+            if self.closed:
+                return  # The manager holding the progress table is gone
+        self.progress_table.pop(job_id, None)
+
+    def _expire_failures(self):
+        now = time.time()
+        for job_id, job in list(self.jobs.items()):
+            if "finished_at" in job and now - job["finished_at"] > self.failure_ttl:
+                del self.jobs[job_id]
+                self.in_flight.pop(job["key"], None)
+        for job_id, job in list(self.jobs.items()):
+            future = job["future"]
+            if future.cancelled() or (future.done() and future.exception() is None and job["key"] not in self.in_flight):
+                del self.jobs[job_id]
+
+    # Current state of a job: queued, running, done or failed, with progress, result or error
+    def status(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job is None:
+            return {"state": "unknown"}
+        future = job["future"]
+        if future.cancelled():
+            return {"state": "unknown"}
+        if future.done():
+            error = future.exception()
+            if error is not None:
+                return {"state": "failed", "error": error}
+            return {"state": "done", "result": future.result()}
+        progress = self.progress_table.get(job_id)
+        if progress is None:
+            return {"state": "queued", "progress": {"stage": "Waiting for a worker", "fraction": 0.0}}
+        return {"state": "running", "progress": dict(progress)}
+
+    def shutdown(self):
+        with self.lock:
+            self.closed = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.manager.shutdown()
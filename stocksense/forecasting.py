@@ -0,0 +1,84 @@
+import datetime
+import importlib
+
+# Forecast model registry: dropdown label -> "module:function".
+# Backends import their libraries (scikit-learn, statsmodels, TensorFlow)
+# at module level, so nothing heavy loads until a model is first used.
+MODEL_BACKENDS = {
+    "Polynomial Regression": "regression_models:polynomial_forecast",
+    "Linear Regression": "regression_models:linear_forecast",
+    "ARIMA": "arima_models:arima_forecast",
+    "ARIMA (Auto)": "arima_models:auto_arima_forecast",
+    "LSTM": "lstm_models:lstm_forecast",
+    "LSTM (Direct)": "lstm_models:lstm_direct_forecast",
+    "LSTM (Fast Recursive)": "lstm_models:lstm_fast_recursive_forecast",
+}
+MODEL_TYPES = list(MODEL_BACKENDS)
+# Backends that train and save a model per ticker in model_store, by the family of store entries they
+# write. Models in one family share entries (both one-step LSTMs use "<ticker>_lstm"), so their jobs
+# for a ticker must not run at the same time.
+MODEL_STORE_FAMILIES = {
+    "ARIMA (Auto)": "arima",
+    "LSTM": "lstm",
+    "LSTM (Direct)": "lstm_direct",
+    "LSTM (Fast Recursive)": "lstm",
+}
+
+# Stage every backend reports once fitting is done and prediction starts
+FORECAST_STAGE = "Forecasting"
+
+_forecasters = {}
+_progress_callback = None
+_batch_worker = False
+
+# Route progress updates from model backends (fit stage, training epoch) to a listener
+def set_progress_callback(callback):
+    global _progress_callback
+    _progress_callback = callback
+
+def report_progress(stage, fraction=None, **details):
+    if _progress_callback is not None:
+        _progress_callback(dict(details, stage=stage, fraction=fraction))
+
+# Pool initializer for batch runners (backtest, forecast_cli) whose workers already keep every core
+# busy: backends then run their internal searches serially instead of starting pools of their own
+def mark_batch_worker():
+    global _batch_worker
+    _batch_worker = True
+
+def in_batch_worker():
+    return _batch_worker
+
+# Add or replace a model backend
+def register_model(model_type, target):
+    MODEL_BACKENDS[model_type] = target
+    _forecasters.pop(model_type, None)
+    if model_type not in MODEL_TYPES:
+        MODEL_TYPES.append(model_type)
+
+# Resolve a model backend, importing its module on first use
+def get_forecaster(model_type):
+    if model_type not in _forecasters:
+        if model_type not in MODEL_BACKENDS:
+            raise ValueError(f"Unknown prediction model: {model_type}")
+        module_name, function_name = MODEL_BACKENDS[model_type].split(":")
+        _forecasters[model_type] = getattr(importlib.import_module(module_name), function_name)
+    return _forecasters[model_type]
+
+# Stored-model entry family a forecast reads and writes, or None when it persists nothing
+def store_family(model_type, ticker):
+    family = MODEL_STORE_FAMILIES.get(model_type)
+    return (ticker, family) if family and ticker else None
+
+# Predict stock prices using selected model
+def predict_stock_prices(data, days, model_type, ticker=None):
+    if data.empty:
+        raise ValueError("No data available for the given ticker.")
+
+    last_date = data.index[-1]
+    future_dates = [last_date + datetime.timedelta(days=i) for i in range(1, days+1)]
+    report_progress(f"Loading {model_type}", fraction=0.0)
+    forecaster = get_forecaster(model_type)
+    predictions = forecaster(data, future_dates, ticker)
+    report_progress("Done", fraction=1.0)
+    return future_dates, predictions
@@ -0,0 +1,224 @@
+import os
+import re
+import sys
+import operator
+import time
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import market_data
+
+# Fundamentals store configuration
+FUNDAMENTALS_FILE = os.environ.get(
+    "STOCKSENSE_FUNDAMENTALS_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "fundamentals.parquet")
+)
+FUNDAMENTALS_TTL = int(os.environ.get("STOCKSENSE_FUNDAMENTALS_TTL", "86400"))
+FUNDAMENTALS_WORKERS = int(os.environ.get("STOCKSENSE_FUNDAMENTALS_WORKERS", "16"))
+
+# Store column -> info key
+INFO_FIELDS = {
+    "name": "shortName",
+    "sector": "sector",
+    "industry": "industry",
+    "profit_margin": "profitMargins",
+    "debt_to_equity": "debtToEquity",
+    "operating_cashflow": "operatingCashflow",
+    "return_on_equity": "returnOnEquity",
+    "market_cap": "marketCap",
+    "trailing_pe": "trailingPE",
+    "current_price": "currentPrice",
+}
+TEXT_FIELDS = ["name", "sector", "industry"]
+STORE_COLUMNS = list(INFO_FIELDS) + ["refreshed_at"]
+
+# Screen filters are parsed with this grammar and never reach DataFrame.query/eval, so text typed
+# into the app cannot call methods or reach local variables:
+#   filter := condition (("and" | "or") condition)*      "and" binds tighter than "or"
+#   condition := column ("<" | "<=" | ">" | ">=" | "==" | "!=") (number | quoted text)
+SCREEN_OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+SCREEN_CONDITION = re.compile(
+    r"""\s*([A-Za-z_][A-Za-z0-9_]*)\s*(<=|>=|==|!=|<|>)\s*"""
+    r"""(-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|'[^']*'|"[^"]*")\s*"""
+)
+SCREEN_JOIN = re.compile(r"(and|or)\s+", re.IGNORECASE)
+
+# Last loaded store, reused until the file changes
+_loaded = {"version": None, "frame": None}
+_lock = threading.Lock()
+# Serializes read-modify-write of the store between sessions refreshing different tickers
+_write_lock = threading.Lock()
+
+def empty_fundamentals():
+    frame = pd.DataFrame({column: pd.Series(dtype=object if column in TEXT_FIELDS else float) for column in STORE_COLUMNS})
+    frame.index = pd.Index([], name="symbol", dtype=object)
+    return frame
+
+def _numeric(value):
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+
+# One store row from an info dict
+def fundamentals_row(info):
+    row = {column: info.get(key) if column in TEXT_FIELDS else _numeric(info.get(key)) for column, key in INFO_FIELDS.items()}
+    row["refreshed_at"] = time.time()
+    return row
+
+# Health score (1-10) for every row at once; missing fundamentals count as 0
+def health_scores(frame):
+    profitability = frame["profit_margin"].fillna(0) * 100
+    debt_levels = frame["debt_to_equity"].fillna(0)
+    cash_flow = frame["operating_cashflow"].fillna(0)
+    roe = frame["return_on_equity"].fillna(0) * 100
+    score = (
+        (profitability / 20) +  # Max 5 points
+        (10 - np.minimum(debt_levels, 10)) +  # Max 5 points
+        (cash_flow / 1e9) +  # Max 5 points
+        (roe / 20)  # Max 5 points
+    )
+    return score.clip(1, 10)
+
+# Stored fundamentals plus the derived columns queries refer to
+def with_health_scores(frame):
+    frame = frame.copy()
+    frame["profitability"] = frame["profit_margin"] * 100
+    frame["roe"] = frame["return_on_equity"] * 100
+    frame["cash_flow_b"] = frame["operating_cashflow"] / 1e9
+    frame["health_score"] = health_scores(frame)
+    return frame
+
+# Fundamentals with health scores, read once per version of the store file
+def load_fundamentals(path=FUNDAMENTALS_FILE):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return with_health_scores(empty_fundamentals())
+    # Every write replaces the file, so the inode identifies a version even within one mtime tick
+    version = (path, stat.st_ino, stat.st_mtime_ns)
+    with _lock:
+        if _loaded["version"] == version:
+            return _loaded["frame"]
+    frame = with_health_scores(pd.read_parquet(path))
+    with _lock:
+        _loaded["version"], _loaded["frame"] = version, frame
+    return frame
+
+# Write through a uniquely named temp file in the same directory, then swap it in
+def _write_fundamentals(frame, path):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".parquet.tmp")
+    os.close(fd)
+    try:
+        frame.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# Fetch info for symbols missing from the store or older than max_age, concurrently, and rewrite the store
+def refresh_fundamentals(symbols, path=FUNDAMENTALS_FILE, max_age=FUNDAMENTALS_TTL, workers=FUNDAMENTALS_WORKERS):
+    stored = load_fundamentals(path)[STORE_COLUMNS]
+    symbols = [symbol.upper() for symbol in symbols]
+    refreshed_at = stored["refreshed_at"].reindex(symbols)
+    stale = [symbol for symbol, at in refreshed_at.items() if not at >= time.time() - max_age]
+    if not stale:
+        return 0, {}
+
+    def fetch(symbol):
+        try:
+            return symbol, fundamentals_row(market_data.info(symbol)), None
+        except Exception as e:
+            return symbol, None, str(e)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(stale)))) as executor:
+        results = list(executor.map(fetch, stale))
+
+    rows = {symbol: row for symbol, row, _ in results if row is not None}
+    failures = {symbol: error for symbol, _, error in results if error is not None}
+    if rows:
+        updates = pd.DataFrame.from_dict(rows, orient="index")
+        updates.index.name = "symbol"
+        # Merge into the store as it is now, not as it was before fetching, so rows written
+        # meanwhile by another session are kept
+        with _write_lock:
+            stored = load_fundamentals(path)[STORE_COLUMNS]
+            frame = pd.concat([stored.drop(index=updates.index, errors="ignore"), updates[stored.columns]])
+            _write_fundamentals(frame.sort_index(), path)
+    return len(rows), failures
+
+# Parse a screen filter into OR-groups of AND-ed (column, operator, value) conditions; ValueError if invalid
+def parse_filter(query, columns):
+    groups = [[]]
+    position = 0
+    while True:
+        match = SCREEN_CONDITION.match(query, position)
+        if match is None:
+            raise ValueError(f"Expected 'column operator value' at: {query[position:]!r}")
+        column, op, value = match.groups()
+        if column not in columns:
+            raise ValueError(f"Unknown column: {column}")
+        if value[0] in "'\"":
+            if op not in ("==", "!="):
+                raise ValueError(f"Text can only be compared with == or !=: {match.group(0).strip()!r}")
+            value = value[1:-1]
+        else:
+            value = float(value)
+        groups[-1].append((column, SCREEN_OPERATORS[op], value))
+        position = match.end()
+        if position == len(query):
+            return groups
+        join = SCREEN_JOIN.match(query, position)
+        if join is None:
+            raise ValueError(f"Expected 'and' or 'or' at: {query[position:]!r}")
+        if join.group(1).lower() == "or":
+            groups.append([])
+        position = join.end()
+
+# Boolean row mask for a parsed filter
+def filter_mask(frame, groups):
+    mask = np.zeros(len(frame), dtype=bool)
+    for conditions in groups:
+        group_mask = np.ones(len(frame), dtype=bool)
+        for column, compare, value in conditions:
+            group_mask &= compare(frame[column], value).fillna(False).to_numpy(dtype=bool)
+        mask |= group_mask
+    return mask
+
+# Filter with a simple condition list (e.g. "health_score > 7 and debt_to_equity < 1") and sort
+def screen(frame, query=None, sort_by="health_score", ascending=False, limit=None):
+    if query:
+        frame = frame[filter_mask(frame, parse_filter(query, frame.columns))]
+    if sort_by:
+        frame = frame.sort_values(sort_by, ascending=ascending, na_position="last")
+    return frame.head(limit) if limit else frame
+
+if __name__ == "__main__":
+    from forecast_cli import read_tickers
+
+    parser = argparse.ArgumentParser(description="Refresh and screen the local fundamentals store")
+    parser.add_argument("--universe", help="File with one ticker symbol per line to refresh")
+    parser.add_argument("--max-age", type=int, default=FUNDAMENTALS_TTL, help="Refresh rows older than this many seconds")
+    parser.add_argument("--workers", type=int, default=FUNDAMENTALS_WORKERS, help="Concurrent info requests")
+    parser.add_argument("--query", help='Filter, e.g. "health_score > 7 and debt_to_equity < 1"')
+    parser.add_argument("--sort", default="health_score", help="Column to sort by (descending)")
+    parser.add_argument("--limit", type=int, default=25, help="Rows to print")
+    args = parser.parse_args()
+
+    if args.universe:
+        refreshed, failures = refresh_fundamentals(read_tickers(args.universe), max_age=args.max_age, workers=args.workers)
+        for symbol, error in failures.items():
+            print(f"FAILED {symbol}: {error}", file=sys.stderr)
+        print(f"Refreshed {refreshed} symbols into {FUNDAMENTALS_FILE}")
+
+    columns = ["name", "sector", "health_score", "profitability", "debt_to_equity", "cash_flow_b", "roe"]
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(screen(load_fundamentals(), args.query, args.sort, limit=args.limit)[columns].round(2))
@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import shutil
+import threading
+import pandas as pd
+import market_data
+
+# History cache configuration
+HISTORY_CACHE_DIR = os.environ.get(
+    "STOCKSENSE_HISTORY_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "history_cache")
+)
+HISTORY_CACHE_MAX_ENTRIES = int(os.environ.get("STOCKSENSE_HISTORY_CACHE_MAX_ENTRIES", "500"))
+HISTORY_CACHE_MAX_IDLE_DAYS = int(os.environ.get("STOCKSENSE_HISTORY_CACHE_MAX_IDLE_DAYS", "30"))
+# Access times are kept in memory and written with the manifest at most this often when nothing else changed
+HISTORY_CACHE_ACCESS_FLUSH = int(os.environ.get("STOCKSENSE_HISTORY_CACHE_ACCESS_FLUSH", "300"))
+
+# Seconds before a cached series is topped up from upstream, per bar interval
+REFRESH_TTL = {
+    "1m": 60,
+    "2m": 120,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "60m": 3600,
+    "1h": 3600,
+}
+DEFAULT_REFRESH_TTL = int(os.environ.get("STOCKSENSE_HISTORY_CACHE_TTL", "3600"))
+
+# Persistent on-disk history cache with a per-symbol high-water mark.
+# Cold reads fetch the full period once; warm refreshes only request bars
+# from the last stored bar onwards and merge them into the Parquet store.
+class HistoryCache(market_data.MarketDataProvider):
+    def __init__(self, upstream=None, root=HISTORY_CACHE_DIR, max_entries=HISTORY_CACHE_MAX_ENTRIES,
+                 max_idle_days=HISTORY_CACHE_MAX_IDLE_DAYS):
+        self.upstream = upstream
+        self.root = root
+        self.store = market_data.WarehouseProvider(root)
+        self.max_entries = max_entries
+        self.max_idle_seconds = max_idle_days * 86400
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self.lock = threading.RLock()
+        # Per-series locks: one fetch per symbol at a time while different symbols fetch concurrently
+        self.key_locks = {}
+        self.manifest = self._load_manifest()
+        self.saved_at = time.time()
+
+    def _load_manifest(self):
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)
+        return {}
+
+    def _save_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+        self.saved_at = time.time()
+
+    def _upstream(self):
+        return self.upstream or market_data.get_provider()
+
+    def _requested_start(self, period):
+        if period in (None, "max"):
+            return None
+        now = pd.Timestamp.now()
+        if period in market_data.PERIOD_OFFSETS:
+            return now - market_data.PERIOD_OFFSETS[period]
+        if period == "ytd":
+            return now.normalize().replace(month=1, day=1)
+        if period.endswith("d") and period[:-1].isdigit():
+            # Weekends and holidays make N sessions span more calendar days
+            return now.normalize() - pd.Timedelta(days=int(period[:-1]) * 2 + 4)
+        raise ValueError(f"Unsupported period: {period}")
+
+    def _covers(self, entry, period):
+        if entry.get("coverage_start") is None:
+            return True
+        requested = self._requested_start(period)
+        return requested is not None and pd.Timestamp(entry["coverage_start"]) <= requested
+
+    def _key_lock(self, key):
+        with self.lock:
+            return self.key_locks.setdefault(key, threading.Lock())
+
+    # Upstream requests run outside the manifest lock so different symbols can fetch in parallel.
+    # The store is read under the series lock, so no fetch or eviction can replace it mid-read.
+    def history(self, symbol, period="1mo", interval="1d", start=None):
+        symbol = symbol.upper()
+        key = f"{symbol}|{interval}"
+        with self._key_lock(key):
+            with self.lock:
+                entry = self.manifest.get(key)
+                now = time.time()
+                full = entry is None or (start is None and not self._covers(entry, period))
+                stale = not full and now - entry["refreshed_at"] > REFRESH_TTL.get(interval, DEFAULT_REFRESH_TTL)
+            if full:
+                self._full_fetch(symbol, period, interval, key)
+            elif stale:
+                self._incremental_fetch(symbol, interval, key)
+            with self.lock:
+                entry = self.manifest.get(key)
+                if entry is None:
+                    return market_data.empty_history()
+                entry["accessed_at"] = now
+                # Fresh hits only touch memory; the manifest is written when a fetch changed it
+                if full or stale or now - self.saved_at > HISTORY_CACHE_ACCESS_FLUSH:
+                    self._evict()
+                    self._save_manifest()
+            return self.store.history(symbol, period=period, interval=interval, start=start)
+
+    def info(self, symbol):
+        return self._upstream().info(symbol)
+
+    def _full_fetch(self, symbol, period, interval, key):
+        data = self._upstream().history(symbol, period=period, interval=interval)
+        if data.empty:
+            return
+        requested = self._requested_start(period)
+        with self.lock:
+            self._drop_entry(key, symbol, interval)
+            self.store.write_history(symbol, interval, data)
+            self.manifest[key] = {
+                "symbol": symbol,
+                "interval": interval,
+                "coverage_start": requested.isoformat() if requested is not None else None,
+                "high_water_mark": data.index.max().isoformat(),
+                "refreshed_at": time.time(),
+                "accessed_at": time.time(),
+                "rows_fetched": len(data),
+            }
+
+    def _incremental_fetch(self, symbol, interval, key):
+        with self.lock:
+            high_water_mark = pd.Timestamp(self.manifest[key]["high_water_mark"])
+        # Refetch from the high-water mark itself; the last stored bar may have been partial
+        data = self._upstream().history(symbol, interval=interval, start=high_water_mark.strftime("%Y-%m-%d"))
+        with self.lock:
+            entry = self.manifest.get(key)
+            if entry is None:
+                return
+            entry["refreshed_at"] = time.time()
+            entry["rows_fetched"] = len(data)
+            if data.empty:
+                return
+            self.store.write_history(symbol, interval, data[data.index >= high_water_mark])
+            entry["high_water_mark"] = max(high_water_mark, data.index.max()).isoformat()
+
+    def _drop_entry(self, key, symbol, interval):
+        self.manifest.pop(key, None)
+        shutil.rmtree(self.store._symbol_dir(symbol, interval), ignore_errors=True)
+
+    # Drop series idle for longer than max_idle_days, then least recently used beyond max_entries.
+    # Series being fetched or read hold their lock and are skipped until a later pass.
+    def _evict(self):
+        now = time.time()
+        by_access = sorted(self.manifest.items(), key=lambda item: item[1]["accessed_at"])
+        excess = len(by_access) - self.max_entries
+        for key, entry in by_access:
+            if excess > 0 or now - entry["accessed_at"] > self.max_idle_seconds:
+                key_lock = self.key_locks.setdefault(key, threading.Lock())
+                if not key_lock.acquire(blocking=False):
+                    continue
+                try:
+                    self._drop_entry(key, entry["symbol"], entry["interval"])
+                finally:
+                    key_lock.release()
+                excess -= 1
+
+    # Series lock first, then the manifest lock, in the same order as history()
+    def invalidate(self, symbol, interval="1d"):
+        symbol = symbol.upper()
+        key = f"{symbol}|{interval}"
+        with self._key_lock(key), self.lock:
+            self._drop_entry(key, symbol, interval)
+            self._save_manifest()
+
+    def clear(self):
+        with self.lock:
+            entries = list(self.manifest.items())
+        for key, entry in entries:
+            with self._key_lock(key), self.lock:
+                self._drop_entry(key, entry["symbol"], entry["interval"])
+        with self.lock:
+            self._save_manifest()
+
+_cache = None
+
+# Shared history cache for this process
+def get_history_cache():
+    global _cache
+    if _cache is None:
+        _cache = HistoryCache()
+    return _cache
+
+# Fetch price history through the on-disk incremental cache
+def history(symbol, period="1mo", interval="1d", start=None):
+    return get_history_cache().history(symbol, period=period, interval=interval, start=start)
@@ -0,0 +1,121 @@
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras.models import Sequential
+from tensorflow.keras.layers import LSTM, Dense
+from tensorflow.keras.callbacks import Callback
+from sklearn.preprocessing import MinMaxScaler
+import model_store
+import windowing
+import forecasting
+
+# Horizons the direct multi-output LSTM is trained for; a request uses the smallest that covers it
+DIRECT_HORIZONS = (30, 90, 180, 365)
+
+# Report each finished training epoch to the forecast progress hook
+class EpochProgress(Callback):
+    def __init__(self, stage):
+        super().__init__()
+        self.stage = stage
+
+    def on_epoch_end(self, epoch, logs=None):
+        epochs = self.params.get("epochs", 1)
+        forecasting.report_progress(self.stage, fraction=(epoch + 1) / epochs, epoch=epoch + 1, epochs=epochs)
+
+# Build the two-layer LSTM network; horizon > 1 emits that many future steps at once
+def build_lstm_model(time_step, horizon=1):
+    model = Sequential()
+    model.add(LSTM(50, return_sequences=True, input_shape=(time_step, 1)))
+    model.add(LSTM(50, return_sequences=False))
+    model.add(Dense(25))
+    model.add(Dense(horizon))
+    model.compile(optimizer='adam', loss='mean_squared_error')
+    return model
+
+# Train an LSTM for the ticker, reusing the stored model when the history only grew by a few bars
+def train_lstm(values, index, time_step, ticker=None, horizon=1):
+    if len(values) < time_step + horizon:
+        raise ValueError(f"Not enough history to train an LSTM for {horizon} day(s).")
+    store_key = None
+    if ticker:
+        store_key = f"{ticker}_lstm" if horizon == 1 else f"{ticker}_lstm_h{horizon}"
+    entry = model_store.load(store_key) if store_key else None
+    if entry is not None:
+        model, scaler, meta = entry
+        new_rows = model_store.new_rows_since(meta, values, index)
+        if (meta.get("time_step") == time_step and meta.get("horizon", 1) == horizon
+                and new_rows is not None and new_rows <= model_store.MAX_FINE_TUNE_ROWS):
+            scaled_data = scaler.transform(values)
+            if new_rows > 0:
+                # Fine-tune only on the windows whose targets reach into the new bars
+                trained_rows = len(values) - new_rows
+                X_new, y_new = windowing.sliding_windows(scaled_data[trained_rows - time_step - horizon + 1:], time_step, horizon)
+                model.fit(X_new, y_new, epochs=5, batch_size=64, verbose=0,
+                          callbacks=[EpochProgress("Fine-tuning LSTM")])
+                model_store.save(store_key, model, scaler, values, index, time_step=time_step, horizon=horizon)
+            return model, scaler, scaled_data
+
+    scaler = MinMaxScaler(feature_range=(0, 1))
+    scaled_data = scaler.fit_transform(values)
+    X_train, y_train = windowing.sliding_windows(scaled_data, time_step, horizon)
+
+    model = build_lstm_model(time_step, horizon)
+    model.fit(X_train, y_train, epochs=5, batch_size=64, verbose=0,  # Reduced epochs for speed
+              callbacks=[EpochProgress("Training LSTM")])
+    if store_key:
+        model_store.save(store_key, model, scaler, values, index, time_step=time_step, horizon=horizon)
+    return model, scaler, scaled_data
+
+# Compiled single-step call per model, so recursive forecasts skip predict()'s per-call setup.
+# It lives on the model itself and is collected with it.
+def lstm_step_function(model):
+    step = getattr(model, "_stocksense_step", None)
+    if step is None:
+        step = tf.function(lambda window: model(window, training=False))
+        model._stocksense_step = step
+    return step
+
+# Roll a one-step LSTM forward `days` times, feeding each prediction back into the window
+def recursive_forecast(model, last_window, days):
+    time_step = len(last_window)
+    step = lstm_step_function(model)
+    buffer = np.empty(time_step + days, dtype=np.float32)
+    buffer[:time_step] = np.asarray(last_window).ravel()
+    for i in range(days):
+        window = tf.constant(buffer[i:i + time_step].reshape(1, time_step, 1))
+        buffer[time_step + i] = step(window).numpy()[0, 0]
+    return buffer[time_step:]
+
+# One-step LSTM rolled forward with a predict() call per future day
+def lstm_forecast(data, future_dates, ticker=None):
+    time_step = 60
+    days = len(future_dates)
+    model, scaler, scaled_data = train_lstm(data[['Close']].values, data.index, time_step, ticker)
+    forecasting.report_progress(forecasting.FORECAST_STAGE, fraction=0.9)
+
+    last_60_days = scaled_data[-time_step:]
+    predictions = []
+    for _ in range(days):
+        X_test = last_60_days.reshape(1, time_step, 1)
+        pred_price = model.predict(X_test, verbose=0)
+        predictions.append(pred_price[0][0])
+        last_60_days = np.append(last_60_days[1:], pred_price)
+
+    return scaler.inverse_transform(np.array(predictions).reshape(-1, 1)).flatten()
+
+# Same one-step model, rolled forward through the compiled call path
+def lstm_fast_recursive_forecast(data, future_dates, ticker=None):
+    time_step = 60
+    model, scaler, scaled_data = train_lstm(data[['Close']].values, data.index, time_step, ticker)
+    forecasting.report_progress(forecasting.FORECAST_STAGE, fraction=0.9)
+    predictions = recursive_forecast(model, scaled_data[-time_step:], len(future_dates))
+    return scaler.inverse_transform(predictions.reshape(-1, 1)).flatten()
+
+# Multi-output LSTM; one forward pass emits the whole horizon
+def lstm_direct_forecast(data, future_dates, ticker=None):
+    time_step = 60
+    days = len(future_dates)
+    horizon = next((h for h in DIRECT_HORIZONS if h >= days), days)
+    model, scaler, scaled_data = train_lstm(data[['Close']].values, data.index, time_step, ticker, horizon)
+    forecasting.report_progress(forecasting.FORECAST_STAGE, fraction=0.9)
+    scaled_predictions = model(windowing.last_window(scaled_data, time_step), training=False).numpy()[0][:days]
+    return scaler.inverse_transform(scaled_predictions.reshape(-1, 1)).flatten()
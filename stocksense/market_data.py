@@ -0,0 +1,251 @@
+import os
+import json
+import argparse
+import pandas as pd
+import yfinance as yf
+import single_flight
+
+# Market data configuration
+# STOCKSENSE_DATA_PROVIDER selects where price history comes from:
+#   "yfinance"  - live Yahoo Finance requests (default)
+#   "warehouse" - local Parquet warehouse only, no network access
+DATA_PROVIDER = os.environ.get("STOCKSENSE_DATA_PROVIDER", "yfinance")
+WAREHOUSE_DIR = os.environ.get(
+    "STOCKSENSE_WAREHOUSE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "warehouse")
+)
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+PERIOD_OFFSETS = {
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "3y": pd.DateOffset(years=3),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+# Empty price frame returned when a symbol has no data
+def empty_history():
+    return pd.DataFrame(columns=PRICE_COLUMNS)
+
+# Resolve a yfinance-style period ("1d", "5d", "3mo", "3y", "ytd", "max") to a start timestamp
+def period_start(index, period):
+    if period is None or period == "max" or len(index) == 0:
+        return None
+    end = index.max()
+    if period == "ytd":
+        return end.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0, nanosecond=0)
+    if period in PERIOD_OFFSETS:
+        return end - PERIOD_OFFSETS[period]
+    if period.endswith("d") and period[:-1].isdigit():
+        # Trading-day periods count sessions, not calendar days
+        sessions = index.normalize().unique().sort_values()
+        return sessions[-min(int(period[:-1]), len(sessions))]
+    raise ValueError(f"Unsupported period: {period}")
+
+# Provider interface shared by every price and fundamentals lookup
+class MarketDataProvider:
+    def history(self, symbol, period="1mo", interval="1d", start=None):
+        raise NotImplementedError
+
+    def info(self, symbol):
+        raise NotImplementedError
+
+    # Histories for many symbols as {symbol: frame}; providers with a bulk endpoint override this
+    def history_many(self, symbols, period="1mo", interval="1d"):
+        return {symbol: self.history(symbol, period=period, interval=interval) for symbol in symbols}
+
+# Live provider backed by Yahoo Finance
+class YFinanceProvider(MarketDataProvider):
+    def history(self, symbol, period="1mo", interval="1d", start=None):
+        stock = yf.Ticker(symbol)
+        if start is not None:
+            return stock.history(start=start, interval=interval)
+        return stock.history(period=period, interval=interval)
+
+    def info(self, symbol):
+        return yf.Ticker(symbol).info
+
+    # One multi-ticker download instead of a request per symbol
+    def history_many(self, symbols, period="1mo", interval="1d"):
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+        data = yf.download(symbols, period=period, interval=interval, group_by="ticker", actions=True,
+                           auto_adjust=True, ignore_tz=False, threads=True, progress=False)
+        histories = {}
+        for symbol in symbols:
+            if data is None or symbol not in data.columns.get_level_values(0):
+                histories[symbol] = empty_history()
+            else:
+                histories[symbol] = data[symbol].dropna(how="all").rename_axis(columns=None)
+        return histories
+
+# Local columnar warehouse: one Parquet file per symbol, interval and year
+#   <root>/interval=1d/symbol=AAPL/year=2024.parquet
+#   <root>/info/AAPL.json
+class WarehouseProvider(MarketDataProvider):
+    def __init__(self, root=WAREHOUSE_DIR):
+        self.root = root
+
+    def _symbol_dir(self, symbol, interval):
+        return os.path.join(self.root, f"interval={interval}", f"symbol={symbol.upper()}")
+
+    def _partitions(self, symbol, interval):
+        symbol_dir = self._symbol_dir(symbol, interval)
+        if not os.path.isdir(symbol_dir):
+            return []
+        partitions = []
+        for name in os.listdir(symbol_dir):
+            if name.startswith("year=") and name.endswith(".parquet"):
+                partitions.append((int(name[5:-8]), os.path.join(symbol_dir, name)))
+        return sorted(partitions)
+
+    def history(self, symbol, period="1mo", interval="1d", start=None):
+        partitions = self._partitions(symbol, interval)
+        if not partitions:
+            return empty_history()
+
+        if start is None and period not in (None, "max"):
+            return self._period_history(partitions, period)
+        if start is not None:
+            start = pd.Timestamp(start)
+            partitions = [(year, path) for year, path in partitions if year >= start.year]
+
+        data = pd.concat([pd.read_parquet(path) for _, path in partitions]).sort_index()
+        if start is not None:
+            if start.tzinfo is None and data.index.tz is not None:
+                start = start.tz_localize(data.index.tz)
+            data = data[data.index >= start]
+        return data
+
+    # Anchor the period on the newest partitions, reading back a year at a time until they cover
+    # its start; a session-count period early in January needs the previous year's bars too
+    def _period_history(self, partitions, period):
+        counts_sessions = period.endswith("d") and period[:-1].isdigit()
+        frames = []
+        for year, path in reversed(partitions):
+            frames.insert(0, pd.read_parquet(path))
+            data = pd.concat(frames)
+            if data.empty:
+                continue
+            start = period_start(data.index, period)
+            if start > data.index.min() or (not counts_sessions and start.year >= year):
+                break
+        if not frames or data.empty:
+            return empty_history()
+        data = data.sort_index()
+        return data[data.index >= start]
+
+    def info(self, symbol):
+        path = os.path.join(self.root, "info", f"{symbol.upper()}.json")
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r") as f:
+            return json.load(f)
+
+    # Merge bars into the symbol's yearly partitions, replacing overlapping timestamps
+    def write_history(self, symbol, interval, data):
+        if data.empty:
+            return
+        symbol_dir = self._symbol_dir(symbol, interval)
+        os.makedirs(symbol_dir, exist_ok=True)
+        for year, bars in data.groupby(data.index.year):
+            path = os.path.join(symbol_dir, f"year={year}.parquet")
+            if os.path.exists(path):
+                bars = pd.concat([pd.read_parquet(path), bars])
+                bars = bars[~bars.index.duplicated(keep="last")].sort_index()
+            tmp_path = path + ".tmp"
+            bars.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+
+    def write_info(self, symbol, info):
+        info_dir = os.path.join(self.root, "info")
+        os.makedirs(info_dir, exist_ok=True)
+        path = os.path.join(info_dir, f"{symbol.upper()}.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump(info, f, default=str)
+        os.replace(path + ".tmp", path)
+
+# Wraps a provider so concurrent identical requests share one upstream fetch
+class CoalescingProvider(MarketDataProvider):
+    def __init__(self, provider):
+        self.provider = provider
+
+    def history(self, symbol, period="1mo", interval="1d", start=None):
+        key = ("history", type(self.provider).__name__, symbol.upper(), period, interval, str(start))
+        return single_flight.do(key, lambda: self.provider.history(symbol, period=period, interval=interval, start=start))
+
+    def info(self, symbol):
+        key = ("info", type(self.provider).__name__, symbol.upper())
+        return single_flight.do(key, lambda: self.provider.info(symbol))
+
+    def history_many(self, symbols, period="1mo", interval="1d"):
+        key = ("history_many", type(self.provider).__name__, tuple(symbol.upper() for symbol in symbols), period, interval)
+        return single_flight.do(key, lambda: self.provider.history_many(symbols, period=period, interval=interval))
+
+PROVIDERS = {
+    "yfinance": YFinanceProvider,
+    "warehouse": WarehouseProvider,
+}
+
+_provider = None
+
+# Active provider for this process, chosen by STOCKSENSE_DATA_PROVIDER; requests to it are coalesced
+def get_provider():
+    global _provider
+    if _provider is None:
+        if DATA_PROVIDER not in PROVIDERS:
+            raise ValueError(f"Unknown data provider: {DATA_PROVIDER}")
+        _provider = CoalescingProvider(PROVIDERS[DATA_PROVIDER]())
+    return _provider
+
+def set_provider(provider):
+    global _provider
+    if not isinstance(provider, CoalescingProvider):
+        provider = CoalescingProvider(provider)
+    _provider = provider
+
+# Fetch price history through the active provider
+def history(symbol, period="1mo", interval="1d", start=None):
+    return get_provider().history(symbol, period=period, interval=interval, start=start)
+
+# Fetch price histories for many symbols through the active provider in one request where supported
+def history_many(symbols, period="1mo", interval="1d"):
+    return get_provider().history_many(symbols, period=period, interval=interval)
+
+# Fetch company fundamentals through the active provider
+def info(symbol):
+    return get_provider().info(symbol)
+
+# Download symbols from Yahoo Finance into the local warehouse for offline use
+def load_warehouse(symbols, period="3y", intervals=("1d",), include_info=True, root=WAREHOUSE_DIR):
+    source = YFinanceProvider()
+    warehouse = WarehouseProvider(root)
+    for symbol in symbols:
+        for interval in intervals:
+            data = source.history(symbol, period=period, interval=interval)
+            warehouse.write_history(symbol, interval, data)
+        if include_info:
+            warehouse.write_info(symbol, source.info(symbol))
+        print(f"Loaded {symbol}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load market data into the local Parquet warehouse")
+    parser.add_argument("symbols", nargs="+", help="Ticker symbols to load")
+    parser.add_argument("--period", default="3y", help="History period to download (default: 3y)")
+    parser.add_argument("--interval", action="append", dest="intervals", help="Bar interval, repeatable (default: 1d)")
+    parser.add_argument("--no-info", action="store_true", help="Skip company fundamentals")
+    parser.add_argument("--root", default=WAREHOUSE_DIR, help="Warehouse directory")
+    args = parser.parse_args()
+    load_warehouse(
+        [symbol.upper() for symbol in args.symbols],
+        period=args.period,
+        intervals=tuple(args.intervals or ["1d"]),
+        include_info=not args.no_info,
+        root=args.root
+    )
@@ -0,0 +1,195 @@
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import threading
+import pandas as pd
+import quote_cache
+
+# Snapshot configuration
+SNAPSHOT_DIR = os.environ.get(
+    "STOCKSENSE_SNAPSHOT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+)
+SNAPSHOT_INTERVAL = int(os.environ.get("STOCKSENSE_SNAPSHOT_INTERVAL", "300"))
+# Older snapshots are ignored and the apps compute the tables themselves
+SNAPSHOT_MAX_AGE = int(os.environ.get("STOCKSENSE_SNAPSHOT_MAX_AGE", str(3 * SNAPSHOT_INTERVAL)))
+SNAPSHOT_KEEP = 5
+SNAPSHOT_FORMAT = 2
+
+SECTOR_ETFS = {
+    "Technology": "XLK",
+    "Healthcare": "XLV",
+    "Financials": "XLF",
+    "Consumer Discretionary": "XLY",
+    "Energy": "XLE",
+    "Utilities": "XLU",
+    "Real Estate": "XLRE",
+    "Materials": "XLB",
+    "Industrials": "XLI",
+    "Communication Services": "XLC",
+    "Consumer Staples": "XLP"
+}
+MOVER_SYMBOLS = ["AAPL", "TSLA", "NVDA", "META", "GOOGL", "MSFT", "AMZN", "AMD", "INTC", "PYPL"]
+RECENT_SYMBOLS = ["AAPL", "TSLA", "GOOGL", "MSFT", "AMZN", "NVDA", "META", "AMD", "INTC", "PYPL"]
+# Info fields of the overview table and their defaults when Yahoo has no value
+RECENT_INFO_FIELDS = {
+    "longName": "Unknown Company",
+    "fiftyTwoWeekHigh": 0,
+    "fiftyTwoWeekLow": 0,
+    "marketCap": 0,
+    "trailingPE": 0,
+    "dividendYield": 0,
+    "trailingEps": 0
+}
+# Placeholder row for symbols that could not be fetched
+RECENT_FALLBACK = {
+    "Company": "Unknown Company",
+    "Price": 100.0,
+    "Volume": 1000000,
+    "Change %": 0.0,
+    "52w high": 110.0,
+    "52w low": 90.0,
+    "Market cap (B)": 100.0,
+    "P/e ratio": 15.0,
+    "Dividend yield": 1.5,
+    "Eps": 5.0
+}
+
+SNAPSHOT_FILE_PATTERN = re.compile(r"^snapshot-(\d+)\.json$")
+
+# Last loaded snapshot, reused until a newer version appears
+_loaded = {"path": None, "snapshot": None}
+_lock = threading.Lock()
+
+# One-month performance (%) of each sector ETF
+def compute_sector_performance():
+    bars = quote_cache.history_many(SECTOR_ETFS.values(), period="1mo")
+    summary = quote_cache.bar_summary(bars)
+    performance = ((summary["close"] - summary["first_close"]) / summary["first_close"] * 100).round(2)
+    return {sector: float(performance[ticker]) for sector, ticker in SECTOR_ETFS.items() if ticker in performance.index}
+
+# Top five of today's gainers among MOVER_SYMBOLS
+def compute_market_movers():
+    try:
+        bars = quote_cache.history_many(MOVER_SYMBOLS, period="1d")
+    except Exception:
+        bars = {}
+    summary = quote_cache.bar_summary(bars)
+    change = ((summary["close"] - summary["open"]) / summary["open"] * 100).round(2)
+    top = change[change >= 0].sort_values(ascending=False, kind="stable").head(5)
+    gainers = [{"symbol": symbol, "change": float(value)} for symbol, value in top.items()]
+    if not gainers:
+        gainers = [{"symbol": f"GAINER{i}", "change": 3.5 - i*0.2} for i in range(5)]
+    return {"gainers": gainers}
+
+# Market overview table for RECENT_SYMBOLS, assembled column-wise
+def compute_recent_data():
+    quotes, failed = quote_cache.quote_frame(RECENT_SYMBOLS, RECENT_INFO_FIELDS)
+    table = pd.DataFrame({
+        "Symbol": quotes.index,
+        "Company": quotes["longName"],
+        "Price": quotes["close"].round(2),
+        "Volume": quotes["volume"].fillna(0).astype(int),
+        "Change %": ((quotes["close"] - quotes["open"]) / quotes["open"] * 100).round(2),
+        "52w high": quotes["fiftyTwoWeekHigh"].round(2),
+        "52w low": quotes["fiftyTwoWeekLow"].round(2),
+        "Market cap (B)": (quotes["marketCap"] / 1e9).round(2),
+        "P/e ratio": quotes["trailingPE"].round(2),
+        "Dividend yield": (quotes["dividendYield"] * 100).round(2),
+        "Eps": quotes["trailingEps"].round(2)
+    })
+    return quote_cache.with_fallback_rows(table, "Symbol", failed, RECENT_FALLBACK, RECENT_SYMBOLS)
+
+# Overview columns as the table shown in the app, numbered from 1
+def recent_data_frame(columns):
+    df = pd.DataFrame(columns)
+    df.index = range(1, len(df) + 1)
+    return df
+
+def _snapshot_versions(root=SNAPSHOT_DIR):
+    if not os.path.isdir(root):
+        return []
+    versions = []
+    for name in os.listdir(root):
+        match = SNAPSHOT_FILE_PATTERN.match(name)
+        if match:
+            versions.append(int(match.group(1)))
+    return sorted(versions)
+
+def _snapshot_path(version, root=SNAPSHOT_DIR):
+    return os.path.join(root, f"snapshot-{version:08d}.json")
+
+# Compute every table and publish it as the next snapshot version; older versions are pruned
+def write_snapshot(root=SNAPSHOT_DIR, keep=SNAPSHOT_KEEP):
+    started = time.time()
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "sector_performance": compute_sector_performance(),
+        "market_movers": compute_market_movers(),
+        "recent_data": compute_recent_data().to_dict("list"),
+    }
+    os.makedirs(root, exist_ok=True)
+    versions = _snapshot_versions(root)
+    snapshot["version"] = (versions[-1] + 1) if versions else 1
+    snapshot["created_at"] = time.time()
+    snapshot["compute_seconds"] = round(snapshot["created_at"] - started, 3)
+
+    path = _snapshot_path(snapshot["version"], root)
+    with open(path + ".tmp", "w") as f:
+        json.dump(snapshot, f)
+    os.replace(path + ".tmp", path)
+    for version in versions[:max(len(versions) + 1 - keep, 0)]:
+        try:
+            os.remove(_snapshot_path(version, root))
+        except OSError:
+            pass
+    return snapshot
+
+# Newest snapshot that is no older than max_age seconds, or None
+def load_latest(root=SNAPSHOT_DIR, max_age=SNAPSHOT_MAX_AGE):
+    versions = _snapshot_versions(root)
+    if not versions:
+        return None
+    path = _snapshot_path(versions[-1], root)
+    with _lock:
+        snapshot = _loaded["snapshot"] if _loaded["path"] == path else None
+    if snapshot is None:
+        try:
+            with open(path, "r") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if snapshot.get("format") != SNAPSHOT_FORMAT:
+            return None
+        with _lock:
+            _loaded["path"], _loaded["snapshot"] = path, snapshot
+    if time.time() - snapshot["created_at"] > max_age:
+        return None
+    return snapshot
+
+# Scheduler loop: refresh the snapshot every `interval` seconds
+def run_scheduler(interval=SNAPSHOT_INTERVAL, root=SNAPSHOT_DIR):
+    while True:
+        started = time.time()
+        try:
+            snapshot = write_snapshot(root)
+            print(f"Wrote snapshot v{snapshot['version']} in {snapshot['compute_seconds']:.1f}s", flush=True)
+        except Exception as e:
+            print(f"Snapshot refresh failed: {e}", file=sys.stderr, flush=True)
+        time.sleep(max(interval - (time.time() - started), 0))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute sector performance, market movers and overview tables")
+    parser.add_argument("--interval", type=int, default=SNAPSHOT_INTERVAL, help="Seconds between refreshes")
+    parser.add_argument("--once", action="store_true", help="Write one snapshot and exit")
+    parser.add_argument("--dir", default=SNAPSHOT_DIR, help="Snapshot directory")
+    args = parser.parse_args()
+
+    if args.once:
+        snapshot = write_snapshot(args.dir)
+        print(f"Wrote snapshot v{snapshot['version']} in {snapshot['compute_seconds']:.1f}s")
+    else:
+        run_scheduler(args.interval, args.dir)
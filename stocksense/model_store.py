@@ -0,0 +1,171 @@
+import os
+import re
+import json
+import time
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+import numpy as np
+from sklearn.preprocessing import MinMaxScaler
+
+# Model store configuration
+MODEL_STORE_DIR = os.environ.get(
+    "STOCKSENSE_MODEL_STORE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "model_store")
+)
+# More new bars than this since the last training triggers a full retrain
+MAX_FINE_TUNE_ROWS = int(os.environ.get("STOCKSENSE_MAX_FINE_TUNE_ROWS", "60"))
+# Loaded models kept in memory per process; least recently used ones are dropped beyond this
+MODEL_CACHE_SIZE = int(os.environ.get("STOCKSENSE_MODEL_CACHE_SIZE", "16"))
+
+SCALER_ATTRIBUTES = ["min_", "scale_", "data_min_", "data_max_", "data_range_"]
+
+# Loaded models kept in memory so repeat requests skip deserialization, bounded as an LRU
+_loaded = OrderedDict()
+_lock = threading.Lock()
+
+# In-memory entry for key, or None; caller holds _lock
+def _recall(key):
+    entry = _loaded.get(key)
+    if entry is not None:
+        _loaded.move_to_end(key)
+    return entry
+
+def _remember(key, entry):
+    with _lock:
+        _loaded[key] = entry
+        _loaded.move_to_end(key)
+        while len(_loaded) > MODEL_CACHE_SIZE:
+            _loaded.popitem(last=False)
+
+def _entry_dir(key):
+    return os.path.join(MODEL_STORE_DIR, re.sub(r"[^A-Za-z0-9._-]", "_", key))
+
+def scaler_to_dict(scaler):
+    params = {name: getattr(scaler, name).tolist() for name in SCALER_ATTRIBUTES}
+    params["feature_range"] = list(scaler.feature_range)
+    params["n_samples_seen_"] = int(scaler.n_samples_seen_)
+    return params
+
+def scaler_from_dict(params):
+    scaler = MinMaxScaler(feature_range=tuple(params["feature_range"]))
+    for name in SCALER_ATTRIBUTES:
+        setattr(scaler, name, np.array(params[name]))
+    scaler.n_samples_seen_ = params["n_samples_seen_"]
+    scaler.n_features_in_ = len(params["min_"])
+    return scaler
+
+# Load a stored model, its scaler and metadata; returns None when nothing is stored
+def load(key):
+    with _lock:
+        entry = _recall(key)
+    if entry is not None:
+        return entry
+
+    meta = _read_meta(key)
+    if meta is None:
+        return None
+
+    from tensorflow.keras.models import load_model
+    model = load_model(os.path.join(_entry_dir(key), "model.keras"))
+    entry = (model, scaler_from_dict(meta["scaler"]), meta)
+    _remember(key, entry)
+    return entry
+
+def _read_meta(key):
+    meta_path = os.path.join(_entry_dir(key), "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, "r") as f:
+        return json.load(f)
+
+# Timestamp and close of the last two trained bars; later histories are matched against these
+# rather than a digest of the whole series, which a rolling window invalidates by dropping its first bar
+def series_anchors(values, index):
+    closes = np.asarray(values, dtype=np.float64).ravel()
+    return [{"timestamp": str(index[i]), "close": float(closes[i])} for i in range(max(len(closes) - 2, 0), len(closes))]
+
+# Write a file in the entry directory through a uniquely named hidden temp file, so concurrent loads
+# and writers in other processes never see it half-written; write(path) produces the file.
+# The temp name keeps the extension because Keras picks its save format from it.
+def _atomic_write(key, name, write):
+    fd, tmp_path = tempfile.mkstemp(dir=_entry_dir(key), prefix=f".{name}.", suffix=os.path.splitext(name)[1])
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, os.path.join(_entry_dir(key), name))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def _write_json(path, value):
+    with open(path, "w") as f:
+        json.dump(value, f)
+
+def _write_pickle(path, value):
+    with open(path, "wb") as f:
+        pickle.dump(value, f)
+
+def _write_meta(key, values, index, **extra):
+    meta = {
+        "rows": len(values),
+        "anchors": series_anchors(values, index),
+        "trained_at": time.time(),
+    }
+    meta.update(extra)
+    _atomic_write(key, "meta.json", lambda path: _write_json(path, meta))
+    return meta
+
+# Persist a trained model with its scaler and the fingerprint of the data it was trained on
+def save(key, model, scaler, values, index, **extra):
+    os.makedirs(_entry_dir(key), exist_ok=True)
+    _atomic_write(key, "model.keras", model.save)
+    meta = _write_meta(key, values, index, scaler=scaler_to_dict(scaler), **extra)
+
+    _remember(key, (model, scaler, meta))
+    return meta
+
+# Load a pickled fitted results object (e.g. statsmodels ARIMA) and its metadata
+def load_results(key):
+    with _lock:
+        entry = _recall(key)
+    if entry is not None:
+        return entry
+
+    meta = _read_meta(key)
+    if meta is None:
+        return None
+    with open(os.path.join(_entry_dir(key), "results.pkl"), "rb") as f:
+        entry = (pickle.load(f), meta)
+    _remember(key, entry)
+    return entry
+
+# Persist a fitted results object with the fingerprint of the data it was fitted on
+def save_results(key, results, values, index, **extra):
+    os.makedirs(_entry_dir(key), exist_ok=True)
+    _atomic_write(key, "results.pkl", lambda path: _write_pickle(path, results))
+    meta = _write_meta(key, values, index, **extra)
+
+    _remember(key, (results, meta))
+    return meta
+
+# Number of bars after the last trained bar that is still present with the same close, or None if
+# the history diverged. With revised_last, a last trained bar whose close changed (a partial intraday
+# bar that has since completed) is matched through the bar before it and counted as new.
+def new_rows_since(meta, values, index, revised_last=True):
+    anchors = meta.get("anchors", [])
+    if not revised_last:
+        anchors = anchors[-1:]
+    closes = np.asarray(values, dtype=np.float64).ravel()
+    positions = {str(timestamp): i for i, timestamp in enumerate(index)}
+    for anchor in reversed(anchors):
+        position = positions.get(anchor["timestamp"])
+        if position is not None and np.isclose(closes[position], anchor["close"], rtol=1e-9, atol=1e-6):
+            return len(closes) - 1 - position
+    return None
+
+def evict(key):
+    with _lock:
+        _loaded.pop(key, None)
@@ -0,0 +1,163 @@
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+import requests
+from requests.adapters import HTTPAdapter
+import lxml.html
+import single_flight
+
+# News feed configuration; point NEWS_BASE_URL at a local server to test without the network
+NEWS_BASE_URL = os.environ.get("STOCKSENSE_NEWS_BASE_URL", "https://finance.yahoo.com").rstrip("/")
+# Entries younger than NEWS_TTL are served as is; older ones up to NEWS_STALE_TTL are served
+# while a background request revalidates them
+NEWS_TTL = int(os.environ.get("STOCKSENSE_NEWS_TTL", "300"))
+NEWS_STALE_TTL = int(os.environ.get("STOCKSENSE_NEWS_STALE_TTL", "3600"))
+# After a failed refresh, the key is served from what is cached (or empty) for this long before the
+# upstream is tried again, so an outage does not stall every rerun for NEWS_TIMEOUT
+NEWS_FAILURE_TTL = int(os.environ.get("STOCKSENSE_NEWS_FAILURE_TTL", "30"))
+NEWS_TIMEOUT = float(os.environ.get("STOCKSENSE_NEWS_TIMEOUT", "10"))
+NEWS_WORKERS = int(os.environ.get("STOCKSENSE_NEWS_WORKERS", "8"))
+NEWS_LIMIT = 5
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Headlines from a Yahoo Finance quote news page
+def parse_ticker_news(html, base_url=NEWS_BASE_URL):
+    if not html.strip():
+        return []
+    document = lxml.html.fromstring(html)
+    news_items = []
+    for item in document.xpath("//li[contains(concat(' ', normalize-space(@class), ' '), ' js-stream-content ')]"):
+        titles = item.xpath(".//h3")
+        links = item.xpath(".//a/@href")
+        title = titles[0].text_content().strip() if titles else "No title available"
+        link = links[0] if links else "#"
+        if not link.startswith("http"):
+            link = base_url + link
+        news_items.append({"title": title, "link": link})
+        if len(news_items) == NEWS_LIMIT:
+            break
+    return news_items
+
+# News cache over a pooled HTTP session.
+# Page requests are conditional (ETag / Last-Modified), so unchanged pages cost a 304 and no parsing.
+class NewsFeed:
+    def __init__(self, base_url=NEWS_BASE_URL, ttl=NEWS_TTL, stale_ttl=NEWS_STALE_TTL,
+                 timeout=NEWS_TIMEOUT, workers=NEWS_WORKERS, failure_ttl=NEWS_FAILURE_TTL):
+        self.base_url = base_url.rstrip("/")
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.failure_ttl = failure_ttl
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.entries = {}
+        self.revalidating = set()
+        # Key -> time before which a failed refresh is not retried
+        self.failed_until = {}
+        self.lock = threading.Lock()
+        self.counts = {"hits": 0, "stale_hits": 0, "misses": 0, "requests": 0, "not_modified": 0, "errors": 0, "failure_hits": 0}
+
+    def _count(self, name):
+        with self.lock:
+            self.counts[name] += 1
+
+    # Cached value for key, loading it with load(previous_entry) -> entry when missing or expired.
+    # Expired entries within stale_ttl are returned immediately and refreshed in the background.
+    # A failed refresh is not retried for failure_ttl; meanwhile the key serves what is cached, or nothing.
+    def get(self, key, load):
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            age = now - entry["fetched_at"] if entry is not None else None
+            if age is not None and age < self.ttl:
+                self.counts["hits"] += 1
+                return entry["items"]
+            backing_off = self.failed_until.get(key, 0) > now
+            if age is not None and age < self.stale_ttl:
+                self.counts["stale_hits"] += 1
+                if key not in self.revalidating and not backing_off:
+                    self.revalidating.add(key)
+                    self.executor.submit(self._refresh, key, load, entry)
+                return entry["items"]
+            if backing_off:
+                self.counts["failure_hits"] += 1
+                return entry["items"] if entry is not None else []
+            self.counts["misses"] += 1
+        # Sessions missing the same key together share one request
+        return single_flight.do(("news", self.base_url, key), lambda: self._refresh(key, load, entry))
+
+    def _refresh(self, key, load, entry):
+        try:
+            entry = load(entry)
+            with self.lock:
+                self.entries[key] = entry
+                self.failed_until.pop(key, None)
+            return entry["items"]
+        except Exception:
+            with self.lock:
+                self.counts["errors"] += 1
+                self.failed_until[key] = time.time() + self.failure_ttl
+            return entry["items"] if entry is not None else []
+        finally:
+            with self.lock:
+                self.revalidating.discard(key)
+
+    # Loader for an HTML page, sending the validators of the cached copy
+    def _page_loader(self, url, parse):
+        def load(entry):
+            headers = {}
+            if entry is not None and entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry is not None and entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            self._count("requests")
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and entry is not None:
+                self._count("not_modified")
+                return dict(entry, fetched_at=time.time())
+            response.raise_for_status()
+            return {
+                "items": parse(response.text, self.base_url),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            }
+        return load
+
+    def ticker_news_url(self, ticker):
+        symbol = quote(ticker)
+        return f"{self.base_url}/quote/{symbol}/news?p={symbol}"
+
+    # Top headlines for one ticker
+    def ticker_news(self, ticker):
+        url = self.ticker_news_url(ticker)
+        return self.get(url, self._page_loader(url, parse_ticker_news))
+
+    # Headlines for many tickers, fetched concurrently over the pooled session
+    def news_for(self, tickers):
+        return dict(zip(tickers, self.executor.map(self.ticker_news, tickers)))
+
+    # Cache any other news source: fetch() returns the items and is called at most once per TTL
+    def cached(self, key, fetch):
+        return self.get(key, lambda entry: {"items": fetch(), "fetched_at": time.time()})
+
+    def stats(self):
+        with self.lock:
+            return dict(self.counts, entries=len(self.entries))
+
+_feed = None
+_feed_lock = threading.Lock()
+
+# Shared news feed for this process
+def get_news_feed():
+    global _feed
+    with _feed_lock:
+        if _feed is None:
+            _feed = NewsFeed()
+        return _feed
@@ -0,0 +1,196 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import market_data
+
+# Quote cache configuration
+QUOTE_CACHE_MAX_BYTES = int(os.environ.get("STOCKSENSE_QUOTE_CACHE_MAX_BYTES", str(32 * 2**20)))
+# Seconds bars stay fresh, by interval; intraday bars expire about once per bar
+QUOTE_TTL = {
+    "1m": 60,
+    "2m": 120,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "60m": 1800,
+    "1h": 1800,
+    "1d": 900,
+}
+DEFAULT_QUOTE_TTL = 300
+INFO_TTL = int(os.environ.get("STOCKSENSE_INFO_TTL", "900"))
+# Concurrent info lookups when filling a multi-symbol table
+QUOTE_WORKERS = int(os.environ.get("STOCKSENSE_QUOTE_WORKERS", "8"))
+
+_MISSING = object()
+
+def _size(value):
+    if hasattr(value, "memory_usage"):
+        return int(value.memory_usage(index=True).sum())
+    return len(repr(value))
+
+# Process-wide LRU of recent bars and info shared by every session.
+# Entries expire after a per-interval TTL and memory is bounded by the approximate size of the cached values.
+class QuoteCache:
+    def __init__(self, max_bytes=QUOTE_CACHE_MAX_BYTES, workers=QUOTE_WORKERS):
+        self.max_bytes = max_bytes
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    # Cached value for key, or load() when it is missing or older than ttl seconds
+    def get_or_load(self, key, ttl, load):
+        with self.lock:
+            value = self._lookup(key, time.time())
+        if value is not _MISSING:
+            return value
+        value = load()
+        self.put(key, value, ttl)
+        return value
+
+    # Fresh cached value or _MISSING, counting the hit or miss; caller holds the lock
+    def _lookup(self, key, now):
+        entry = self.entries.get(key)
+        if entry is not None and entry["expires_at"] > now:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry["value"]
+        if entry is not None:
+            self._remove(key)
+            self.expirations += 1
+        self.misses += 1
+        return _MISSING
+
+    def put(self, key, value, ttl):
+        size = _size(value)
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            self.entries[key] = {"value": value, "expires_at": time.time() + ttl, "size": size}
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        self.size -= self.entries.pop(key)["size"]
+
+    # Bars for symbol; callers share the returned frame and must not modify it
+    def history(self, symbol, period="1mo", interval="1d"):
+        symbol = symbol.upper()
+        return self.get_or_load(("history", symbol, period, interval), QUOTE_TTL.get(interval, DEFAULT_QUOTE_TTL),
+                                lambda: market_data.history(symbol, period=period, interval=interval))
+
+    def info(self, symbol):
+        symbol = symbol.upper()
+        return self.get_or_load(("info", symbol), INFO_TTL, lambda: market_data.info(symbol))
+
+    # Bars for many symbols: cached frames are reused and the rest come from one bulk download
+    def history_many(self, symbols, period="1mo", interval="1d"):
+        symbols = [symbol.upper() for symbol in symbols]
+        now = time.time()
+        with self.lock:
+            found = {symbol: self._lookup(("history", symbol, period, interval), now) for symbol in symbols}
+        missing = [symbol for symbol, value in found.items() if value is _MISSING]
+        if missing:
+            fetched = market_data.history_many(missing, period=period, interval=interval)
+            ttl = QUOTE_TTL.get(interval, DEFAULT_QUOTE_TTL)
+            for symbol in missing:
+                found[symbol] = fetched.get(symbol, market_data.empty_history())
+                self.put(("history", symbol, period, interval), found[symbol], ttl)
+        return found
+
+    # Info for many symbols, looked up concurrently; symbols whose lookup failed map to None
+    def info_many(self, symbols):
+        def safe_info(symbol):
+            try:
+                return self.info(symbol)
+            except Exception:
+                return None
+        symbols = [symbol.upper() for symbol in symbols]
+        return dict(zip(symbols, self.executor.map(safe_info, symbols)))
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+_cache = None
+_cache_lock = threading.Lock()
+
+# Shared quote cache for this process
+def get_quote_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = QuoteCache()
+        return _cache
+
+def history(symbol, period="1mo", interval="1d"):
+    return get_quote_cache().history(symbol, period=period, interval=interval)
+
+def info(symbol):
+    return get_quote_cache().info(symbol)
+
+def history_many(symbols, period="1mo", interval="1d"):
+    return get_quote_cache().history_many(symbols, period=period, interval=interval)
+
+def info_many(symbols):
+    return get_quote_cache().info_many(symbols)
+
+# Session summary of each symbol's bars as columns, one row per symbol that has bars
+def bar_summary(bars):
+    live = [symbol for symbol, data in bars.items() if not data.empty]
+    return pd.DataFrame({
+        "open": [float(bars[symbol]["Open"].iloc[0]) for symbol in live],
+        "first_close": [float(bars[symbol]["Close"].iloc[0]) for symbol in live],
+        "close": [float(bars[symbol]["Close"].iloc[-1]) for symbol in live],
+        "volume": [float(bars[symbol]["Volume"].iloc[-1]) for symbol in live],
+    }, index=pd.Index(live, dtype=object))
+
+# Latest bars and info fields for many symbols, one row per symbol, built column-wise.
+# `fields` maps info keys to defaults; numeric fields are coerced and gaps take the default.
+# Returns the frame and the symbols whose bars or info could not be fetched; symbols without bars are dropped.
+def quote_frame(symbols, fields, period="1d", interval="1m"):
+    symbols = [symbol.upper() for symbol in symbols]
+    try:
+        bars = history_many(symbols, period=period, interval=interval)
+    except Exception:
+        bars = {}
+    infos = info_many(symbols)
+    failed = [symbol for symbol in symbols if symbol not in bars or infos[symbol] is None]
+    frame = bar_summary({symbol: bars[symbol] for symbol in symbols if symbol not in failed})
+    for field, default in fields.items():
+        column = pd.Series([infos[symbol].get(field) for symbol in frame.index], index=frame.index, dtype=object)
+        if isinstance(default, (int, float)):
+            column = pd.to_numeric(column, errors="coerce")
+        frame[field] = column.fillna(default)
+    return frame, failed
+
+# Append placeholder rows for failed symbols and put the rows back in `order`
+def with_fallback_rows(table, key, failed, fallback, order):
+    if failed:
+        rows = pd.DataFrame({key: failed, **{column: [value] * len(failed) for column, value in fallback.items()}})
+        table = pd.concat([table, rows], ignore_index=True) if len(table) else rows
+    position = {symbol: i for i, symbol in enumerate(order)}
+    return table.iloc[table[key].map(position).to_numpy().argsort(kind="stable")].reset_index(drop=True)
@@ -0,0 +1,18 @@
+import batch_regression
+import forecasting
+
+# Least-squares polynomial trend over normalized time, via the batched regression engine
+def trend_forecast(data, future_dates, degree):
+    closes, last_dates = batch_regression.align_closes({"Close": data})
+    coefficients, origin, scale = batch_regression.fit_trends(closes, degree)
+    forecasting.report_progress(forecasting.FORECAST_STAGE, fraction=0.9)
+    last_ordinal = last_dates["Close"].toordinal()
+    return batch_regression.predict_trends(coefficients, origin, scale, [last_ordinal], len(future_dates))[0]
+
+# Cubic trend over the dates
+def polynomial_forecast(data, future_dates, ticker=None):
+    return trend_forecast(data, future_dates, degree=3)
+
+# Straight-line trend over the dates
+def linear_forecast(data, future_dates, ticker=None):
+    return trend_forecast(data, future_dates, degree=1)
@@ -0,0 +1,74 @@
+import os
+import numpy as np
+import pandas as pd
+
+# Risk engine configuration
+RISK_BENCHMARK = os.environ.get("STOCKSENSE_RISK_BENCHMARK", "^GSPC")
+TRADING_DAYS = 252
+ROLLING_WINDOW = 21  # About one trading month
+VAR_CONFIDENCE = 0.95
+
+# Simple daily returns of a Close series as a float array
+def daily_returns(close):
+    close = np.asarray(close, dtype=float)
+    return close[1:] / close[:-1] - 1
+
+# Annualized volatility over a trailing window, from running sums of returns and squared returns
+def rolling_volatility(returns, window=ROLLING_WINDOW):
+    if len(returns) < window:
+        return np.array([])
+    sums = np.concatenate([[0.0], np.cumsum(returns)])
+    squares = np.concatenate([[0.0], np.cumsum(returns ** 2)])
+    window_sum = sums[window:] - sums[:-window]
+    window_squares = squares[window:] - squares[:-window]
+    variance = (window_squares - window_sum ** 2 / window) / (window - 1)
+    return np.sqrt(np.maximum(variance, 0.0) * TRADING_DAYS)
+
+# Largest peak-to-trough fall of a price series, as a negative fraction
+def max_drawdown(close):
+    close = np.asarray(close, dtype=float)
+    if len(close) == 0:
+        return np.nan
+    return float(np.min(close / np.maximum.accumulate(close) - 1))
+
+# Historical one-day Value at Risk and Conditional VaR (expected shortfall), as positive loss fractions
+def value_at_risk(returns, confidence=VAR_CONFIDENCE):
+    cutoff = np.quantile(returns, 1 - confidence)
+    return float(-cutoff), float(-returns[returns <= cutoff].mean())
+
+# Regression beta of the stock's returns on the benchmark's, over the dates both traded
+def regression_beta(data, benchmark):
+    closes = pd.concat([_daily_close(data), _daily_close(benchmark)], axis=1, join="inner").to_numpy()
+    if len(closes) < 3:
+        return None
+    stock, market = daily_returns(closes[:, 0]), daily_returns(closes[:, 1])
+    market_deviation = market - market.mean()
+    market_variance = market_deviation @ market_deviation
+    if market_variance == 0:
+        return None
+    return float(market_deviation @ (stock - stock.mean()) / market_variance)
+
+# Close prices keyed by calendar date, so histories from different exchanges or timezones line up
+def _daily_close(data):
+    index = data.index.tz_localize(None) if data.index.tz is not None else data.index
+    close = pd.Series(data["Close"].to_numpy(dtype=float), index=index.normalize())
+    return close[~close.index.duplicated(keep="last")]
+
+# All risk metrics from an already-fetched history; beta is None without a usable benchmark.
+# Histories with fewer than two returns get NaN volatility and VaR rather than an error.
+def risk_metrics(data, benchmark=None):
+    close = data["Close"].to_numpy(dtype=float)
+    returns = daily_returns(close)
+    if len(returns) < 2:
+        volatility, var, cvar = np.nan, np.nan, np.nan
+    else:
+        volatility = float(returns.std(ddof=1) * np.sqrt(TRADING_DAYS))
+        var, cvar = value_at_risk(returns)
+    return {
+        "volatility": volatility,
+        "rolling_volatility": pd.Series(rolling_volatility(returns), index=data.index[ROLLING_WINDOW:]),
+        "max_drawdown": max_drawdown(close),
+        "var": var,
+        "cvar": cvar,
+        "beta": regression_beta(data, benchmark) if benchmark is not None and not benchmark.empty else None,
+    }
@@ -0,0 +1,66 @@
+import threading
+
+# One in-flight call shared by its concurrent duplicates
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+# Coalesces concurrent identical calls: the first caller for a key runs the fetch,
+# callers arriving while it is in flight wait and share its result or exception.
+# Nothing is cached once the call returns; freshness stays with the caches in front of it.
+class SingleFlight:
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+        self.executed = 0
+        self.deduplicated = 0
+        self.errors = 0
+
+    def do(self, key, fn):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.deduplicated += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            with self.lock:
+                self.errors += 1
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+
+    def stats(self):
+        with self.lock:
+            return {
+                "in_flight": len(self.calls),
+                "executed": self.executed,
+                "deduplicated": self.deduplicated,
+                "errors": self.errors,
+            }
+
+# Process-wide group in front of every upstream market data and news request
+_group = SingleFlight()
+
+def do(key, fn):
+    return _group.do(key, fn)
+
+def stats():
+    return _group.stats()
@@ -0,0 +1,491 @@
+import os
+import sys
+import copy
+import json
+import time
+import atexit
+import sqlite3
+import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# User store configuration
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+USER_STORE_BACKEND = os.environ.get("STOCKSENSE_USER_STORE", "sqlite")
+USER_DB_FILE = os.environ.get("STOCKSENSE_USER_DB", os.path.join(APP_DIR, "users.db"))
+USER_JSON_FILE = os.environ.get("STOCKSENSE_USER_JSON", os.path.join(APP_DIR, "users.json"))
+# Seconds the JSON store waits to gather concurrent changes into one write
+USER_COMMIT_WINDOW = float(os.environ.get("STOCKSENSE_USER_COMMIT_WINDOW", "0.05"))
+# Seconds a trade or sign-up waits for its commit before giving up
+USER_COMMIT_TIMEOUT = float(os.environ.get("STOCKSENSE_USER_COMMIT_TIMEOUT", "10"))
+# Seconds the JSON writer waits before retrying a failed write
+USER_WRITE_RETRY = float(os.environ.get("STOCKSENSE_USER_WRITE_RETRY", "1"))
+STARTING_BALANCE = 10000.0
+
+def new_user(password, email):
+    return {
+        "password": password,
+        "email": email,
+        "balance": STARTING_BALANCE,
+        "portfolio": {},
+        "watchlist": [],
+        "transactions": [],
+        "price_alerts": []
+    }
+
+def trade_time():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+# Storage for user accounts, portfolios, transactions, watchlists and price alerts.
+# Reads return one user's record as a dict; every change is one call that returns the updated record.
+class UserStore:
+    def get_user(self, username):
+        raise NotImplementedError
+
+    # Returns False when the username is taken
+    def create_user(self, username, password, email):
+        raise NotImplementedError
+
+    # Returns the updated user, or None when the balance does not cover the purchase.
+    # Trades raise KeyError for an unknown username, and OSError when the trade was placed but could
+    # not be confirmed on disk; it then stays placed and the store saves it with a later write.
+    def buy(self, username, symbol, quantity, price):
+        raise NotImplementedError
+
+    # Returns the updated user, or None when the user holds fewer shares
+    def sell(self, username, symbol, quantity, price):
+        raise NotImplementedError
+
+    def add_to_watchlist(self, username, symbol):
+        raise NotImplementedError
+
+    def update_profile(self, username, email=None, password=None):
+        raise NotImplementedError
+
+    def set_price_alerts(self, username, alerts):
+        raise NotImplementedError
+
+# All users in one JSON file, held in memory. Changes mark their user dirty and a background
+# writer group-commits them: only dirty users are re-serialized, and the file is replaced atomically.
+# Trades and sign-ups wait until the commit holding them is on disk; other changes return at once.
+class JsonUserStore(UserStore):
+    def __init__(self, path=USER_JSON_FILE, commit_window=USER_COMMIT_WINDOW, commit_timeout=USER_COMMIT_TIMEOUT):
+        self.path = path
+        self.commit_window = commit_window
+        self.commit_timeout = commit_timeout
+        self.lock = threading.RLock()
+        self.committed = threading.Condition(self.lock)
+        # Held across snapshot and write so file writes land in version order, without blocking changes
+        self.write_lock = threading.Lock()
+        self.users = {}
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                self.users = json.load(f)
+        # Serialized JSON of each user as last written
+        self.fragments = {username: json.dumps(user) for username, user in self.users.items()}
+        self.dirty = set()
+        self.version = 0
+        self.committed_version = 0
+        # Newest version a failed write covered, and its error; waiters up to it are told instead of hanging
+        self.failed_version = 0
+        self.write_error = None
+        self.counts = {"changes": 0, "commits": 0, "users_serialized": 0, "write_errors": 0}
+        self.writer = threading.Thread(target=self._write_loop, name="user-store-writer", daemon=True)
+        self.writer.start()
+        atexit.register(self.flush)
+
+    # Record a change to username; durable=True blocks until it has been committed to disk and
+    # raises OSError if the write holding it failed or did not finish within commit_timeout.
+    # The change stays applied in memory and is retried by the writer either way.
+    def _changed(self, username, durable=False):
+        self.dirty.add(username)
+        self.version += 1
+        self.counts["changes"] += 1
+        self.committed.notify_all()
+        if durable:
+            version = self.version
+            deadline = time.monotonic() + self.commit_timeout
+            while self.committed_version < version:
+                if self.failed_version >= version:
+                    raise OSError(f"Could not save {username} to {self.path}: {self.write_error}") from self.write_error
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Saving {username} to {self.path} took longer than {self.commit_timeout}s")
+                self.committed.wait(remaining)
+
+    def _write_loop(self):
+        while True:
+            with self.lock:
+                while not self.dirty:
+                    self.committed.wait()
+            # Let changes from concurrent sessions pile up into one write
+            time.sleep(self.commit_window)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"User store write failed, retrying: {e}", file=sys.stderr, flush=True)
+                time.sleep(USER_WRITE_RETRY)
+
+    # Write all pending changes now; on failure the users stay dirty for the next attempt.
+    # The file is written outside the store lock, so sessions keep trading during the fsync.
+    def flush(self):
+        with self.write_lock:
+            with self.lock:
+                if not self.dirty:
+                    return
+                pending = set(self.dirty)
+                for username in pending:
+                    self.fragments[username] = json.dumps(self.users[username])
+                self.counts["users_serialized"] += len(pending)
+                self.dirty.clear()
+                version = self.version
+                content = "{" + ", ".join(f"{json.dumps(username)}: {fragment}" for username, fragment in self.fragments.items()) + "}"
+            try:
+                self._write_file(content)
+            except Exception as e:
+                with self.lock:
+                    self.dirty |= pending
+                    self.failed_version, self.write_error = version, e
+                    self.counts["write_errors"] += 1
+                    self.committed.notify_all()
+                raise
+            with self.lock:
+                self.committed_version = version
+                self.write_error = None
+                self.counts["commits"] += 1
+                self.committed.notify_all()
+
+    def _write_file(self, content):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        directory = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)  # Make the rename itself durable
+        finally:
+            os.close(directory)
+
+    def stats(self):
+        with self.lock:
+            return dict(self.counts, pending=len(self.dirty))
+
+    def _record(self, username):
+        user = self.users[username]
+        user.setdefault("email", "")
+        user.setdefault("portfolio", {})
+        for key in ("watchlist", "transactions", "price_alerts"):
+            user.setdefault(key, [])
+        return user
+
+    def get_user(self, username):
+        with self.lock:
+            if username not in self.users:
+                return None
+            return copy.deepcopy(self._record(username))
+
+    def create_user(self, username, password, email):
+        with self.lock:
+            if username in self.users:
+                return False
+            self.users[username] = new_user(password, email)
+            self._changed(username, durable=True)
+            return True
+
+    def buy(self, username, symbol, quantity, price):
+        with self.lock:
+            user = self._record(username)
+            total_cost = price * quantity
+            if total_cost > user["balance"]:
+                return None
+            user["balance"] -= total_cost
+            position = user["portfolio"].get(symbol)
+            if position:
+                position["avg_price"] = (
+                    (position["avg_price"] * position["quantity"] + price * quantity) / (position["quantity"] + quantity)
+                )
+                position["quantity"] += quantity
+            else:
+                user["portfolio"][symbol] = {"quantity": quantity, "avg_price": price}
+            user["transactions"].append({
+                "time": trade_time(),
+                "symbol": symbol, "action": "Buy", "quantity": quantity, "price": price, "total": total_cost
+            })
+            self._changed(username, durable=True)
+            return copy.deepcopy(user)
+
+    def sell(self, username, symbol, quantity, price):
+        with self.lock:
+            user = self._record(username)
+            position = user["portfolio"].get(symbol)
+            if not position or position["quantity"] < quantity:
+                return None
+            total_cost = price * quantity
+            position["quantity"] -= quantity
+            user["balance"] += total_cost
+            if position["quantity"] == 0:
+                del user["portfolio"][symbol]
+            user["transactions"].append({
+                "time": trade_time(),
+                "symbol": symbol, "action": "Sell", "quantity": quantity, "price": price, "total": total_cost
+            })
+            self._changed(username, durable=True)
+            return copy.deepcopy(user)
+
+    def add_to_watchlist(self, username, symbol):
+        with self.lock:
+            user = self._record(username)
+            if symbol not in user["watchlist"]:
+                user["watchlist"].append(symbol)
+                self._changed(username)
+            return copy.deepcopy(user)
+
+    def update_profile(self, username, email=None, password=None):
+        with self.lock:
+            user = self._record(username)
+            if email and email != user["email"]:
+                user["email"] = email
+                self._changed(username)
+            if password and password != user["password"]:
+                user["password"] = password
+                self._changed(username)
+            return copy.deepcopy(user)
+
+    def set_price_alerts(self, username, alerts):
+        with self.lock:
+            user = self._record(username)
+            alerts = [dict(alert) for alert in alerts]
+            if alerts != user["price_alerts"]:
+                user["price_alerts"] = alerts
+                self._changed(username)
+            return copy.deepcopy(user)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    email TEXT NOT NULL DEFAULT '',
+    balance REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS positions (
+    username TEXT NOT NULL REFERENCES users(username),
+    symbol TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    avg_price REAL NOT NULL,
+    PRIMARY KEY (username, symbol)
+);
+CREATE TABLE IF NOT EXISTS watchlist (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL REFERENCES users(username),
+    symbol TEXT NOT NULL,
+    UNIQUE (username, symbol)
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL REFERENCES users(username),
+    time TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    action TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    price REAL NOT NULL,
+    total REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_by_user ON transactions (username, id);
+CREATE TABLE IF NOT EXISTS price_alerts (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL REFERENCES users(username),
+    symbol TEXT NOT NULL,
+    target_price REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS price_alerts_by_user ON price_alerts (username, id);
+"""
+
+# Users in SQLite (WAL mode): one row per user, indexed ledger tables, one short transaction per change
+class SqliteUserStore(UserStore):
+    def __init__(self, path=USER_DB_FILE, import_from=USER_JSON_FILE):
+        self.path = path
+        self.local = threading.local()
+        created = not os.path.exists(path)
+        self._connection().executescript(SCHEMA)
+        # First start after upgrading: carry the existing users.json over
+        if created and import_from and os.path.exists(import_from):
+            with open(import_from, "r") as f:
+                self.import_users(json.load(f))
+
+    # One connection per thread; Streamlit runs each session on its own thread
+    def _connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")  # A trade is on disk before it is acknowledged
+            conn.execute("PRAGMA foreign_keys=ON")
+            self.local.conn = conn
+        return conn
+
+    # Write transaction that takes the lock up front, so check-then-update steps cannot interleave
+    @contextmanager
+    def _transaction(self):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def get_user(self, username):
+        conn = self._connection()
+        row = conn.execute("SELECT password, email, balance FROM users WHERE username = ?", (username,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "password": row["password"],
+            "email": row["email"],
+            "balance": row["balance"],
+            "portfolio": {
+                position["symbol"]: {"quantity": position["quantity"], "avg_price": position["avg_price"]}
+                for position in conn.execute(
+                    "SELECT symbol, quantity, avg_price FROM positions WHERE username = ? ORDER BY rowid", (username,))
+            },
+            "watchlist": [item["symbol"] for item in conn.execute(
+                "SELECT symbol FROM watchlist WHERE username = ? ORDER BY id", (username,))],
+            "transactions": [dict(transaction) for transaction in conn.execute(
+                "SELECT time, symbol, action, quantity, price, total FROM transactions WHERE username = ? ORDER BY id",
+                (username,))],
+            "price_alerts": [dict(alert) for alert in conn.execute(
+                "SELECT symbol, target_price FROM price_alerts WHERE username = ? ORDER BY id", (username,))],
+        }
+
+    def create_user(self, username, password, email):
+        with self._transaction() as conn:
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO users (username, password, email, balance) VALUES (?, ?, ?, ?)",
+                (username, password, email, STARTING_BALANCE)).rowcount
+        return inserted == 1
+
+    def buy(self, username, symbol, quantity, price):
+        total_cost = price * quantity
+        with self._transaction() as conn:
+            if total_cost > self._balance(conn, username):
+                return None
+            conn.execute("UPDATE users SET balance = balance - ? WHERE username = ?", (total_cost, username))
+            conn.execute(
+                "INSERT INTO positions (username, symbol, quantity, avg_price) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (username, symbol) DO UPDATE SET "
+                "avg_price = (avg_price * quantity + excluded.avg_price * excluded.quantity) / (quantity + excluded.quantity), "
+                "quantity = quantity + excluded.quantity",
+                (username, symbol, quantity, price))
+            self._record_transaction(conn, username, symbol, "Buy", quantity, price, total_cost)
+        return self.get_user(username)
+
+    def sell(self, username, symbol, quantity, price):
+        total_cost = price * quantity
+        with self._transaction() as conn:
+            position = conn.execute(
+                "SELECT quantity FROM positions WHERE username = ? AND symbol = ?", (username, symbol)).fetchone()
+            if position is None:
+                self._balance(conn, username)  # Unknown users raise rather than read as holding nothing
+                return None
+            if position["quantity"] < quantity:
+                return None
+            if position["quantity"] == quantity:
+                conn.execute("DELETE FROM positions WHERE username = ? AND symbol = ?", (username, symbol))
+            else:
+                conn.execute("UPDATE positions SET quantity = quantity - ? WHERE username = ? AND symbol = ?",
+                             (quantity, username, symbol))
+            conn.execute("UPDATE users SET balance = balance + ? WHERE username = ?", (total_cost, username))
+            self._record_transaction(conn, username, symbol, "Sell", quantity, price, total_cost)
+        return self.get_user(username)
+
+    # Balance of the user, raising KeyError like JsonUserStore when there is no such user
+    def _balance(self, conn, username):
+        row = conn.execute("SELECT balance FROM users WHERE username = ?", (username,)).fetchone()
+        if row is None:
+            raise KeyError(username)
+        return row["balance"]
+
+    def _record_transaction(self, conn, username, symbol, action, quantity, price, total, timestamp=None):
+        conn.execute(
+            "INSERT INTO transactions (username, time, symbol, action, quantity, price, total) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (username, timestamp or trade_time(), symbol, action, quantity, price, total))
+
+    def add_to_watchlist(self, username, symbol):
+        with self._transaction() as conn:
+            conn.execute("INSERT OR IGNORE INTO watchlist (username, symbol) VALUES (?, ?)", (username, symbol))
+        return self.get_user(username)
+
+    def update_profile(self, username, email=None, password=None):
+        with self._transaction() as conn:
+            if email:
+                conn.execute("UPDATE users SET email = ? WHERE username = ?", (email, username))
+            if password:
+                conn.execute("UPDATE users SET password = ? WHERE username = ?", (password, username))
+        return self.get_user(username)
+
+    def set_price_alerts(self, username, alerts):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM price_alerts WHERE username = ?", (username,))
+            conn.executemany(
+                "INSERT INTO price_alerts (username, symbol, target_price) VALUES (?, ?, ?)",
+                [(username, alert["symbol"], alert["target_price"]) for alert in alerts])
+        return self.get_user(username)
+
+    # Import users in the users.json layout, replacing any existing rows for the same usernames
+    def import_users(self, users):
+        with self._transaction() as conn:
+            for username, user in users.items():
+                for table in ("positions", "watchlist", "transactions", "price_alerts"):
+                    conn.execute(f"DELETE FROM {table} WHERE username = ?", (username,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO users (username, password, email, balance) VALUES (?, ?, ?, ?)",
+                    (username, user.get("password", ""), user.get("email", ""), user.get("balance", STARTING_BALANCE)))
+                conn.executemany(
+                    "INSERT INTO positions (username, symbol, quantity, avg_price) VALUES (?, ?, ?, ?)",
+                    [(username, symbol, position["quantity"], position["avg_price"])
+                     for symbol, position in user.get("portfolio", {}).items()])
+                conn.executemany(
+                    "INSERT OR IGNORE INTO watchlist (username, symbol) VALUES (?, ?)",
+                    [(username, symbol) for symbol in user.get("watchlist", [])])
+                for transaction in user.get("transactions", []):
+                    self._record_transaction(conn, username, transaction["symbol"], transaction["action"],
+                                             transaction["quantity"], transaction["price"], transaction["total"],
+                                             transaction["time"])
+                conn.executemany(
+                    "INSERT INTO price_alerts (username, symbol, target_price) VALUES (?, ?, ?)",
+                    [(username, alert["symbol"], alert["target_price"]) for alert in user.get("price_alerts", [])])
+        return len(users)
+
+USER_STORES = {
+    "sqlite": SqliteUserStore,
+    "json": JsonUserStore,
+}
+
+_store = None
+_store_lock = threading.Lock()
+
+# Shared user store for this process, chosen by STOCKSENSE_USER_STORE
+def get_user_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            if USER_STORE_BACKEND not in USER_STORES:
+                raise ValueError(f"Unknown user store '{USER_STORE_BACKEND}'. Choose from: {', '.join(USER_STORES)}")
+            _store = USER_STORES[USER_STORE_BACKEND]()
+        return _store
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import users.json into the SQLite user store")
+    parser.add_argument("--json", default=USER_JSON_FILE, help="users.json to import")
+    parser.add_argument("--db", default=USER_DB_FILE, help="SQLite database to write")
+    args = parser.parse_args()
+
+    with open(args.json, "r") as f:
+        users = json.load(f)
+    store = SqliteUserStore(args.db, import_from=None)
+    print(f"Imported {store.import_users(users)} users from {args.json} into {args.db}")
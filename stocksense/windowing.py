@@ -0,0 +1,29 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Build supervised windows over a (rows, features) series without copying it.
+# X[i] holds rows i..i+window-1 and y[i] the next `horizon` values of the
+# target column. Both are strided read-only views over `series`.
+def sliding_windows(series, window, horizon=1, target_column=0):
+    series = np.asarray(series)
+    if series.ndim == 1:
+        series = series.reshape(-1, 1)
+    if window < 1 or horizon < 1:
+        raise ValueError("window and horizon must be positive")
+
+    count = len(series) - window - horizon + 1
+    if count <= 0:
+        return (np.empty((0, window, series.shape[1]), dtype=series.dtype),
+                np.empty((0, horizon), dtype=series.dtype))
+
+    # (count, features, window) -> (count, window, features), still a view
+    X = sliding_window_view(series[:count + window - 1], window, axis=0).transpose(0, 2, 1)
+    y = sliding_window_view(series[window:, target_column], horizon)
+    return X, y
+
+# Most recent window, shaped as a single model input
+def last_window(series, window):
+    series = np.asarray(series)
+    if series.ndim == 1:
+        series = series.reshape(-1, 1)
+    return series[-window:].reshape(1, window, series.shape[1])